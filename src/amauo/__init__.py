@@ -5,22 +5,35 @@ Deploy Bacalhau compute nodes across multiple AWS regions using spot instances
 for cost-effective distributed computing.
 """
 
+import functools
+from typing import Any
+
 __author__ = "Amauo Team"
 __email__ = "hello@amauo.dev"
 
-# Version is now managed by hatch-vcs from git tags
-try:
-    from importlib.metadata import version
-
-    __version__ = version("amauo")
-except ImportError:
-    # Fallback for development/editable installs
-    __version__ = "dev"
-
 
+@functools.cache
 def get_runtime_version() -> str:
-    """Get the package version."""
-    return __version__
+    """Get the package version.
+
+    Resolved from package metadata on first use and cached, so importing the
+    package doesn't pay for the importlib.metadata lookup.
+    """
+    # Version is now managed by hatch-vcs from git tags
+    try:
+        from importlib.metadata import version
+
+        return version("amauo")
+    except ImportError:
+        # Fallback for development/editable installs
+        return "dev"
+
+
+def __getattr__(name: str) -> Any:
+    """Resolve ``__version__`` lazily."""
+    if name == "__version__":
+        return get_runtime_version()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 __all__ = ["get_runtime_version"]
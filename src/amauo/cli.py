@@ -5,34 +5,28 @@ Provides a Click-based CLI for deploying and managing Bacalhau compute nodes
 across multiple AWS regions using spot instances.
 """
 
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import click
-from rich.console import Console
-from rich.panel import Panel
 
 from . import get_runtime_version
-from .commands import (
-    cmd_cleanup,
-    cmd_create,
-    cmd_destroy,
-    cmd_generate,
-    cmd_help,
-    cmd_list,
-    cmd_nuke,
-    cmd_random_ip,
-    cmd_readme,
-    cmd_setup,
-    cmd_validate,
-    cmd_version,
-)
 from .core.config import SimpleConfig
 from .core.state import SimpleStateManager
 
-console = Console()
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+@functools.cache
+def _console() -> "Console":
+    """Create the shared Rich console on first use."""
+    from rich.console import Console
+
+    return Console()
 
 
 def _show_directory_status(
@@ -103,13 +97,15 @@ def _show_directory_status(
             f"AMI Cache: [yellow]⚠️ {cache_dir.absolute()} (will be created)[/yellow]"
         )
 
+    from rich.panel import Panel
+
     panel = Panel(
         "\n".join(info_lines),
         title="[bold]📁 Directory Status[/bold]",
         border_style="blue",
         padding=(0, 1),
     )
-    console.print(panel)
+    _console().print(panel)
 
 
 @click.group(invoke_without_command=True)
@@ -172,8 +168,8 @@ def cli(
         if ctx.invoked_subcommand not in ["setup", "help", "version"]:
             # Show directory status even on error to help troubleshooting
             _show_directory_status(config)
-            console.print(f"[red]❌ Config error: {e}[/red]")
-            console.print("[yellow]💡 Try running 'amauo setup' first[/yellow]")
+            _console().print(f"[red]❌ Config error: {e}[/red]")
+            _console().print("[yellow]💡 Try running 'amauo setup' first[/yellow]")
             sys.exit(1)
 
     # Show help if no command provided
@@ -191,13 +187,15 @@ def create(ctx: click.Context) -> None:
     state: SimpleStateManager = ctx.obj["state"]
     debug: bool = ctx.obj.get("debug", False)
 
+    from .commands import cmd_create
+
     try:
         cmd_create(config, state, debug=debug)
     except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️  Deployment interrupted by user[/yellow]")
+        _console().print("\n[yellow]⚠️  Deployment interrupted by user[/yellow]")
         sys.exit(130)
     except Exception as e:
-        console.print(f"[red]❌ Deployment failed: {e}[/red]")
+        _console().print(f"[red]❌ Deployment failed: {e}[/red]")
         sys.exit(1)
 
 
@@ -209,13 +207,15 @@ def destroy(ctx: click.Context) -> None:
     state: SimpleStateManager = ctx.obj["state"]
     debug: bool = ctx.obj.get("debug", False)
 
+    from .commands import cmd_destroy
+
     try:
         cmd_destroy(config=config, state=state, debug=debug)
     except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️  Destruction interrupted by user[/yellow]")
+        _console().print("\n[yellow]⚠️  Destruction interrupted by user[/yellow]")
         sys.exit(130)
     except Exception as e:
-        console.print(f"[red]❌ Destruction failed: {e}[/red]")
+        _console().print(f"[red]❌ Destruction failed: {e}[/red]")
         sys.exit(1)
 
 
@@ -225,10 +225,12 @@ def list_nodes(ctx: click.Context) -> None:
     """List all running instances with detailed information."""
     state: SimpleStateManager = ctx.obj["state"]
 
+    from .commands import cmd_list
+
     try:
         cmd_list(state)
     except Exception as e:
-        console.print(f"[red]❌ List failed: {e}[/red]")
+        _console().print(f"[red]❌ List failed: {e}[/red]")
         sys.exit(1)
 
 
@@ -238,6 +240,8 @@ def setup(ctx: click.Context) -> None:
     """Set up initial configuration."""
     config_path: str = ctx.obj["config_path"]
 
+    from .commands import cmd_setup
+
     try:
         # Create config if it doesn't exist, then initialize it
         config_file = Path(config_path)
@@ -260,7 +264,7 @@ regions:
         config = SimpleConfig(config_path)
         cmd_setup(config)
     except Exception as e:
-        console.print(f"[red]❌ Setup failed: {e}[/red]")
+        _console().print(f"[red]❌ Setup failed: {e}[/red]")
         sys.exit(1)
 
 
@@ -271,43 +275,15 @@ def nuke(ctx: click.Context) -> None:
     config: SimpleConfig = ctx.obj["config"]
     state: SimpleStateManager = ctx.obj["state"]
 
+    from .commands import cmd_nuke
+
     try:
         cmd_nuke(config=config, state=state)
     except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️  Nuke interrupted by user[/yellow]")
+        _console().print("\n[yellow]⚠️  Nuke interrupted by user[/yellow]")
         sys.exit(130)
     except Exception as e:
-        console.print(f"[red]❌ Nuke failed: {e}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-def generate() -> None:
-    """Generate deployment structure and templates."""
-    try:
-        cmd_generate()
-    except Exception as e:
-        console.print(f"[red]❌ Generate failed: {e}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-def version() -> None:
-    """Show detailed version information."""
-    try:
-        cmd_version()
-    except Exception as e:
-        console.print(f"[red]❌ Version failed: {e}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-def help() -> None:
-    """Show detailed help information."""
-    try:
-        cmd_help()
-    except Exception as e:
-        console.print(f"[red]❌ Help failed: {e}[/red]")
+        _console().print(f"[red]❌ Nuke failed: {e}[/red]")
         sys.exit(1)
 
 
@@ -317,23 +293,12 @@ def random_ip(ctx: click.Context) -> None:
     """Get random instance IP for SSH access."""
     state: SimpleStateManager = ctx.obj["state"]
 
-    try:
-        cmd_random_ip(state)
-    except Exception as e:
-        console.print(f"[red]❌ Random IP failed: {e}[/red]")
-        sys.exit(1)
-
-
-@cli.command()
-@click.pass_context
-def readme(ctx: click.Context) -> None:
-    """Show deployment information and status."""
-    # state: SimpleStateManager = ctx.obj["state"]  # Unused for readme command
+    from .commands import cmd_random_ip
 
     try:
-        cmd_readme()
+        cmd_random_ip(state)
     except Exception as e:
-        console.print(f"[red]❌ Readme failed: {e}[/red]")
+        _console().print(f"[red]❌ Random IP failed: {e}[/red]")
         sys.exit(1)
 
 
@@ -344,21 +309,56 @@ def validate(ctx: click.Context) -> None:
     config: SimpleConfig = ctx.obj["config"]
     state: SimpleStateManager = ctx.obj["state"]
 
+    from .commands import cmd_validate
+
     try:
         cmd_validate(config, state)
     except Exception as e:
-        console.print(f"[red]❌ Validate failed: {e}[/red]")
+        _console().print(f"[red]❌ Validate failed: {e}[/red]")
         sys.exit(1)
 
 
-@cli.command()
-def cleanup() -> None:
-    """Clean up temporary files and prevent conflicts."""
-    try:
-        cmd_cleanup()
-    except Exception as e:
-        console.print(f"[red]❌ Cleanup failed: {e}[/red]")
-        sys.exit(1)
+# Commands that take no options and only run their implementation:
+# (name, implementation in .commands, label for errors, help text)
+_SIMPLE_COMMANDS = [
+    (
+        "generate",
+        "cmd_generate",
+        "Generate",
+        "Generate deployment structure and templates.",
+    ),
+    ("version", "cmd_version", "Version", "Show detailed version information."),
+    ("help", "cmd_help", "Help", "Show detailed help information."),
+    ("readme", "cmd_readme", "Readme", "Show deployment information and status."),
+    (
+        "cleanup",
+        "cmd_cleanup",
+        "Cleanup",
+        "Clean up temporary files and prevent conflicts.",
+    ),
+]
+
+
+def _make_simple_command(
+    name: str, impl: str, label: str, help_text: str
+) -> click.Command:
+    """Build a Click command that runs a no-argument command implementation."""
+
+    def callback() -> None:
+        from . import commands
+
+        run = getattr(commands, impl)
+        try:
+            run()
+        except Exception as e:
+            _console().print(f"[red]❌ {label} failed: {e}[/red]")
+            sys.exit(1)
+
+    return click.Command(name, callback=callback, help=help_text)
+
+
+for _name, _impl, _label, _help in _SIMPLE_COMMANDS:
+    cli.add_command(_make_simple_command(_name, _impl, _label, _help))
 
 
 def main() -> None:
@@ -366,10 +366,10 @@ def main() -> None:
     try:
         cli()
     except KeyboardInterrupt:
-        console.print("\n[yellow]⚠️  Interrupted by user[/yellow]")
+        _console().print("\n[yellow]⚠️  Interrupted by user[/yellow]")
         sys.exit(130)
     except Exception as e:
-        console.print(f"[red]❌ Unexpected error: {e}[/red]")
+        _console().print(f"[red]❌ Unexpected error: {e}[/red]")
         sys.exit(1)
 
 
@@ -1,17 +1,39 @@
-"""Command implementations for amauo deployer."""
+"""Command implementations for amauo deployer.
+
+Command modules are imported on first attribute access so that fast paths
+such as ``--version`` and ``--help`` don't pay for boto3 and friends.
+"""
+
+import importlib
+from typing import Any
+
+# Public name -> (submodule, attribute)
+_COMMANDS = {
+    "cmd_cleanup": ("cleanup", "cmd_cleanup"),
+    "cmd_create": ("create", "cmd_create"),
+    "cmd_destroy": ("destroy", "cmd_destroy"),
+    "cmd_generate": ("generate", "main"),
+    "cmd_help": ("help", "cmd_help"),
+    "cmd_list": ("list", "cmd_list"),
+    "cmd_nuke": ("nuke", "cmd_nuke"),
+    "cmd_random_ip": ("random_ip", "cmd_random_ip"),
+    "cmd_readme": ("readme", "cmd_readme"),
+    "cmd_setup": ("setup", "cmd_setup"),
+    "cmd_validate": ("validate", "cmd_validate"),
+    "cmd_version": ("version", "cmd_version"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a command implementation on first use."""
+    try:
+        module_name, attr = _COMMANDS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(f".{module_name}", __name__), attr)
+    globals()[name] = value
+    return value
 
-from .cleanup import cmd_cleanup
-from .create import cmd_create
-from .destroy import cmd_destroy
-from .generate import main as cmd_generate
-from .help import cmd_help
-from .list import cmd_list
-from .nuke import cmd_nuke
-from .random_ip import cmd_random_ip
-from .readme import cmd_readme
-from .setup import cmd_setup
-from .validate import cmd_validate
-from .version import cmd_version
 
 __all__ = [
     "cmd_cleanup",
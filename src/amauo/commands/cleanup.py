@@ -21,16 +21,19 @@ def cmd_cleanup() -> None:
         return
 
     try:
-        result = subprocess.run(
-            [str(cleanup_script)], check=True, capture_output=True, text=True
-        )
-        console.print(result.stdout)
-        rich_success("Cleanup completed successfully!")
-    except subprocess.CalledProcessError as e:
-        console.print(f"❌ Cleanup failed: {e}")
-        if e.stdout:
-            console.print("STDOUT:", e.stdout)
-        if e.stderr:
-            console.print("STDERR:", e.stderr)
+        # Stream the script's progress as it runs instead of after it exits
+        with subprocess.Popen(
+            [str(cleanup_script)],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        ) as proc:
+            if proc.stdout:
+                for line in proc.stdout:
+                    console.print(line, end="", markup=False, highlight=False)
+        if proc.returncode == 0:
+            rich_success("Cleanup completed successfully!")
+        else:
+            console.print(f"❌ Cleanup failed: exit status {proc.returncode}")
     except Exception as e:
         console.print(f"❌ Unexpected error during cleanup: {e}")
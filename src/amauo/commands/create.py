@@ -1,6 +1,7 @@
 """Create command implementation."""
 
 import os
+import re
 import threading
 import time
 import uuid
@@ -9,7 +10,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any, Optional, cast
 
-import boto3
 from botocore.exceptions import ClientError
 from rich.layout import Layout
 from rich.panel import Panel
@@ -19,7 +19,7 @@ from ..core.config import SimpleConfig
 from ..core.deployment import DeploymentConfig
 from ..core.deployment_discovery import DeploymentDiscovery, DeploymentMode
 from ..core.state import SimpleStateManager
-from ..utils.aws import check_aws_auth
+from ..utils.aws import check_aws_auth, get_caller_identity
 from ..utils.config_validator import ConfigValidator
 from ..utils.display import (
     Live,
@@ -30,12 +30,37 @@ from ..utils.display import (
     rich_success,
     rich_warning,
 )
-from ..utils.logging import ConsoleLogger, setup_logger
+from ..utils.logging import ConsoleLogger, read_log_tail, setup_logger
 from ..utils.portable_cloud_init import PortableCloudInitGenerator
 from ..utils.shutdown_handler import ShutdownContext
 from ..utils.ssh import transfer_files_scp, wait_for_ssh_only
 from ..utils.tables import add_instance_row, create_instance_table
 
+# Upload progress keywords in priority order; only "SSH" is case-sensitive.
+# Group n of the pattern maps to _UPLOAD_STAGES[n - 1]. The lookahead makes
+# every match zero-width, so overlapping keywords (e.g. "setupload") are all
+# seen instead of the first one consuming the rest.
+_UPLOAD_STAGE_RE = re.compile(
+    r"(?=(SSH)|(?i:(tarball|upload)|(verif)|(setup)|(complete)))"
+)
+_UPLOAD_STAGES = (
+    ("🔐", "-"),
+    ("📦", "uploading"),
+    ("✓", "verifying"),
+    ("⚙️", "✓"),
+    ("✅", "✓"),
+)
+
+
+def _upload_stage(status: str) -> tuple[str, str]:
+    """Return the (icon, upload status) pair for an upload progress message.
+
+    All keywords are found in one pass over the message; the highest-priority
+    match wins rather than the leftmost one.
+    """
+    best = min((m.lastindex or 0 for m in _UPLOAD_STAGE_RE.finditer(status)), default=0)
+    return _UPLOAD_STAGES[best - 1] if best else ("📤", "preparing")
+
 
 def update_instance_state(
     state: Any, instance_id: str, status: str, upload_status: str = "-"
@@ -82,19 +107,10 @@ def transfer_portable_files(
                 f"Local tarball size: {local_size} bytes ({tarball_size_mb:.1f} MB)"
             )
 
-            # Connect via SSH
-            log_function("Establishing SSH connection...")
+            # SSH was confirmed by wait_for_ssh_only; a dead connection
+            # surfaces as an upload failure below
             ssh_manager = SSHManager(host, username, key_path)
 
-            # Test SSH connection
-            test_success, _, _ = ssh_manager.execute_command(
-                "echo 'SSH connection test'"
-            )
-            if not test_success:
-                log_function("ERROR: SSH connection failed")
-                return False
-            log_function("✓ SSH connection established")
-
             if progress_callback:
                 progress_callback(
                     "Upload", 10, f"Uploading tarball ({tarball_size_mb:.1f} MB)"
@@ -119,10 +135,13 @@ def transfer_portable_files(
             if progress_callback:
                 progress_callback("Upload", 50, "Verifying upload...")
 
-            # Verify upload by checking remote file size
+            # Verify the remote file size and, only if it matches, create the
+            # upload complete marker in the same SSH round trip
             log_function("Verifying upload completion...")
             success, stdout, stderr = ssh_manager.execute_command(
-                "stat -c%s /tmp/deployment.tar.gz 2>/dev/null || echo 'ERROR'"
+                "size=$(stat -c%s /tmp/deployment.tar.gz 2>/dev/null) || size=ERROR; "
+                f'[ "$size" = "{local_size}" ] && touch /tmp/UPLOAD_COMPLETE; '
+                'echo "$size"'
             )
 
             if not success or stdout.strip() == "ERROR":
@@ -149,10 +168,6 @@ def transfer_portable_files(
 
             if progress_callback:
                 progress_callback("Setup", 75, "Upload verified")
-
-            # Create upload complete marker
-            log_function("Creating upload completion marker...")
-            ssh_manager.execute_command("touch /tmp/UPLOAD_COMPLETE")
             log_function("✓ Upload complete marker created")
 
             if progress_callback:
@@ -189,20 +204,10 @@ def transfer_portable_files(
             if progress_callback:
                 progress_callback("Uploading", 0, "Uploading deployment tarball...")
 
-            # Use ssh_manager with proper initialization
-            log_function("Connecting via SSH...")
+            # SSH was confirmed by wait_for_ssh_only; a dead connection
+            # surfaces as an upload failure below
             ssh_manager = SSHManager(host, username, key_path)
 
-            # Test SSH connection first
-            test_success, _, _ = ssh_manager.execute_command(
-                "echo 'SSH connection established'"
-            )
-            if test_success:
-                log_function("✓ SSH connected successfully")
-            else:
-                log_function("ERROR: SSH connection failed")
-                return False
-
             # Update state to uploading
             if state and instance_id:
                 update_instance_state(state, instance_id, "uploading")
@@ -236,23 +241,20 @@ def transfer_portable_files(
             if progress_callback:
                 progress_callback("Upload", 50, "Tarball uploaded")
 
-            # Create upload complete marker
-            log_function("Creating upload complete marker...")
-            ssh_manager.execute_command("touch /tmp/UPLOAD_COMPLETE")
-            log_function("✓ Upload complete marker created")
-            if progress_callback:
-                progress_callback("Setup", 75, "Signaled upload complete")
-
-            # Trigger setup.sh in background (non-blocking)
-            log_function("Starting setup.sh in background...")
+            # Create the upload complete marker and trigger setup.sh in the
+            # background (non-blocking) with a single SSH command
+            log_function("Creating upload complete marker and starting setup.sh...")
 
             # Update state to setup
             if state and instance_id:
                 update_instance_state(state, instance_id, "setup")
 
             # Wait a bit for cloud-init to detect the marker, then run setup
-            setup_cmd = "nohup bash -c 'sleep 5 && cd /opt/deployment && [ -f setup.sh ] && chmod +x setup.sh && ./setup.sh > /var/log/setup.log 2>&1' > /dev/null 2>&1 &"
-            ssh_manager.execute_command(setup_cmd)
+            setup_cmd = "touch /tmp/UPLOAD_COMPLETE; nohup bash -c 'sleep 5 && cd /opt/deployment && [ -f setup.sh ] && chmod +x setup.sh && ./setup.sh > /var/log/setup.log 2>&1' > /dev/null 2>&1 &"
+            ssh_manager.execute_command(setup_cmd, capture_stdout=False)
+            log_function("✓ Upload complete marker created")
+            if progress_callback:
+                progress_callback("Setup", 75, "Signaled upload complete")
             log_function("✓ Setup.sh started (running in background)")
             if progress_callback:
                 progress_callback("Complete", 100, "Setup.sh launched in background")
@@ -275,7 +277,9 @@ def transfer_portable_files(
         if not deployment_config.uploads:
             log_function("No files to upload (no uploads defined in deployment config)")
             # Still create the marker file to signal completion
-            ssh_manager.execute_command("touch /tmp/UPLOAD_COMPLETE")
+            ssh_manager.execute_command(
+                "touch /tmp/UPLOAD_COMPLETE", capture_stdout=False
+            )
             log_function("Created upload complete marker")
             return True
 
@@ -305,7 +309,9 @@ def transfer_portable_files(
 
         # Create upload complete marker
         if success:
-            ssh_manager.execute_command("touch /tmp/UPLOAD_COMPLETE")
+            ssh_manager.execute_command(
+                "touch /tmp/UPLOAD_COMPLETE", capture_stdout=False
+            )
             log_function("Created upload complete marker")
 
         return success
@@ -317,7 +323,9 @@ def transfer_portable_files(
         # Still try to create the marker so cloud-init doesn't hang forever
         try:
             ssh_manager = SSHManager(host, username, key_path)
-            ssh_manager.execute_command("touch /tmp/UPLOAD_COMPLETE")
+            ssh_manager.execute_command(
+                "touch /tmp/UPLOAD_COMPLETE", capture_stdout=False
+            )
             log_function("Created upload complete marker (despite errors)")
         except Exception:
             pass
@@ -343,9 +351,9 @@ def post_creation_setup(
         logger.error("No private SSH key path configured")
         return
 
-    expanded_key_path = os.path.expanduser(private_key_path)
-    if not os.path.exists(expanded_key_path):
-        logger.error(f"Private SSH key not found at {expanded_key_path}")
+    # SimpleConfig returns SSH key paths already expanded
+    if not os.path.exists(private_key_path):
+        logger.error(f"Private SSH key not found at {private_key_path}")
         return
 
     username = config.username()
@@ -418,7 +426,7 @@ def post_creation_setup(
             if not wait_for_ssh_only(
                 instance_ip,
                 username,
-                expanded_key_path,
+                private_key_path,
                 timeout=300,
                 progress_callback=ssh_progress,
             ):
@@ -433,25 +441,7 @@ def post_creation_setup(
             update_status_func(instance_key, "📦 Preparing upload...")
 
             def progress_callback(phase: str, progress: int, status: str) -> None:
-                # Show detailed progress with icons
-                if "SSH" in status:
-                    icon = "🔐"
-                    upload_st = "-"
-                elif "tarball" in status.lower() or "upload" in status.lower():
-                    icon = "📦"
-                    upload_st = "uploading"
-                elif "verif" in status.lower():
-                    icon = "✓"
-                    upload_st = "verifying"
-                elif "setup" in status.lower():
-                    icon = "⚙️"
-                    upload_st = "✓"
-                elif "complete" in status.lower():
-                    icon = "✅"
-                    upload_st = "✓"
-                else:
-                    icon = "📤"
-                    upload_st = "preparing"
+                icon, upload_st = _upload_stage(status)
                 update_status_func(
                     instance_key, f"{icon} {status}", upload_status=upload_st
                 )
@@ -465,7 +455,7 @@ def post_creation_setup(
                     success = transfer_portable_files(
                         instance_ip,
                         username,
-                        expanded_key_path,
+                        private_key_path,
                         deployment_config,
                         progress_callback=progress_callback,
                         log_function=lambda msg: logger.info(
@@ -489,8 +479,10 @@ def post_creation_setup(
                 try:
                     from ..utils.ssh_manager import SSHManager
 
-                    ssh_manager = SSHManager(instance_ip, username, expanded_key_path)
-                    ssh_manager.execute_command("touch /tmp/UPLOAD_COMPLETE")
+                    ssh_manager = SSHManager(instance_ip, username, private_key_path)
+                    ssh_manager.execute_command(
+                        "touch /tmp/UPLOAD_COMPLETE", capture_stdout=False
+                    )
                     logger.info(
                         f"[{instance_id} @ {instance_ip}] Created upload complete marker (no files)"
                     )
@@ -503,7 +495,7 @@ def post_creation_setup(
                     success = transfer_files_scp(
                         instance_ip,
                         username,
-                        expanded_key_path,
+                        private_key_path,
                         files_directory,
                         scripts_directory,
                         additional_commands_path=additional_commands_path,
@@ -541,7 +533,7 @@ def post_creation_setup(
             logger.error(f"[{instance_id} @ {instance_ip}] Setup failed: {e}")
             error_msg = str(e)
             if len(error_msg) > 40:
-                error_msg = f"{error_msg[:37]}..."
+                error_msg = f"{error_msg:.37}..."
             update_status_func(instance_key, f"ERROR: {error_msg}", is_final=True)
 
     # Process instances in parallel (max 10 concurrent connections)
@@ -574,6 +566,7 @@ def create_instances_in_region_with_table(
     creator: str,
     state: SimpleStateManager,
     deployment_config: Optional[DeploymentConfig] = None,
+    shutdown_ctx: Optional[ShutdownContext] = None,
 ) -> list[dict]:
     """Create spot instances in a specific region with live table updates."""
     if count <= 0:
@@ -585,6 +578,13 @@ def create_instances_in_region_with_table(
         """Thread-safe logging to file."""
         logger.info(msg)
 
+    def pause(seconds: float) -> bool:
+        """Sleep between AWS polls, returning True early if shutdown is requested."""
+        if shutdown_ctx is None:
+            time.sleep(seconds)
+            return False
+        return shutdown_ctx.wait(seconds)
+
     for key in instance_keys:
         update_status_func(key, "Finding VPC")
 
@@ -669,8 +669,7 @@ def create_instances_in_region_with_table(
         public_key_path = config.public_ssh_key_path()
         if public_key_path:
             try:
-                expanded_path = os.path.expanduser(public_key_path)
-                with open(expanded_path) as f:
+                with open(public_key_path) as f:
                     ssh_public_key = f.read().strip()
                     log_message(f"Loaded SSH public key from {public_key_path}")
             except Exception as e:
@@ -784,7 +783,8 @@ def create_instances_in_region_with_table(
                         log_message(
                             f"Rate limited in {region}, retrying in {wait_time} seconds..."
                         )
-                        time.sleep(wait_time)
+                        if pause(wait_time):
+                            raise
                     else:
                         raise
                 else:
@@ -799,51 +799,55 @@ def create_instances_in_region_with_table(
 
         # Wait for instances to get public IPs
         created_instances: list[dict[str, Any]] = []
+        # IDs already in created_instances, for constant-time membership checks
+        created_ids: set[str] = set()
 
         typed_instances = cast(list[dict[str, Any]], result["Instances"])
         instance_ids = [inst["InstanceId"] for inst in typed_instances]
+        key_by_id = dict(zip(instance_ids, instance_keys))
 
         log_message(
             f"Created {len(instance_ids)} instances in {region}, waiting for public IPs..."
         )
 
-        # Immediately save instances to state with minimal info
+        # Immediately save instances to state with minimal info, in one write
         if state:
+            launched = datetime.now().isoformat()
             with lock:
-                for inst_id in instance_ids:
-                    partial_instance = {
-                        "id": inst_id,
-                        "region": region,
-                        "type": machine_type,
-                        "state": "provisioned",  # Deployment state, not AWS state
-                        "public_ip": "pending",
-                        "created": datetime.now().isoformat(),
-                        "ami": ami_id,
-                        "vpc_id": vpc_id,
-                        "subnet_id": subnet_id,
-                        "security_group_id": sg_id,
-                        "deployment_id": deployment_id,
-                        "creator": creator,
-                    }
-                    # Add to state immediately
-                    existing_instances = state.load_instances()
-                    existing_instances.append(partial_instance)
-                    state.save_instances(existing_instances)
+                state.add_instances(
+                    [
+                        {
+                            "id": inst_id,
+                            "region": region,
+                            "type": machine_type,
+                            "state": "provisioned",  # Deployment state, not AWS state
+                            "public_ip": "pending",
+                            "created": launched,
+                            "ami": ami_id,
+                            "vpc_id": vpc_id,
+                            "subnet_id": subnet_id,
+                            "security_group_id": sg_id,
+                            "deployment_id": deployment_id,
+                            "creator": creator,
+                        }
+                        for inst_id in instance_ids
+                    ]
+                )
 
         for i, inst_id in enumerate(instance_ids):
             key = instance_keys[i]
             update_status_func(key, "⏳ Assigning IP... (0s)", instance_id=inst_id)
 
         # Poll for public IPs
-        time.sleep(1)  # Give AWS a moment to register the instances
-        max_attempts = 30
-        poll_start = time.time()
+        interrupted = pause(1)  # Give AWS a moment to register the instances
+        max_attempts = 0 if interrupted else 30
+        poll_start = time.monotonic()
         for attempt in range(max_attempts):
-            elapsed = int(time.time() - poll_start)
+            elapsed = int(time.monotonic() - poll_start)
 
             # Update status for instances still waiting
             for i, inst_id in enumerate(instance_ids):
-                if not any(ci["id"] == inst_id for ci in created_instances):
+                if inst_id not in created_ids:
                     key = instance_keys[i]
                     update_status_func(
                         key, f"⏳ Assigning IP... ({elapsed}s)", instance_id=inst_id
@@ -859,71 +863,74 @@ def create_instances_in_region_with_table(
                     typed_reservation = reservation
                     for inst in typed_reservation["Instances"]:
                         inst_id = inst["InstanceId"]
-                        idx = instance_ids.index(inst_id)
-                        key = instance_keys[idx]
+                        key = key_by_id[inst_id]
 
                         public_ip = inst.get("PublicIpAddress")
                         inst["State"]["Name"]
 
-                        if public_ip:
-                            instance_data = {
-                                "id": inst_id,
-                                "region": region,
-                                "type": machine_type,
-                                "state": "provisioned",  # Deployment state, not AWS state
-                                "public_ip": public_ip,
-                                "created": datetime.now().isoformat(),
-                                "ami": ami_id,
-                                "vpc_id": vpc_id,
-                                "subnet_id": subnet_id,
-                                "security_group_id": sg_id,
-                            }
-
-                            # Check if we already added this instance
-                            if not any(ci["id"] == inst_id for ci in created_instances):
-                                created_instances.append(instance_data)
-                                update_status_func(
-                                    key,
-                                    "SUCCESS: Created",
-                                    instance_id=inst_id,
-                                    ip=public_ip,
-                                    created=datetime.now().strftime(
-                                        "%Y-%m-%d %H:%M:%S"
-                                    ),
-                                )
-
-                                # Update the IP map for logging context
-                                with lock:
-                                    instance_ip_map[inst_id] = public_ip
-
-                                    # Update state with the public IP
-                                    if state:
-                                        instances = state.load_instances()
-                                        for inst in instances:
-                                            if inst["id"] == inst_id:
-                                                inst["public_ip"] = public_ip
-                                                # Don't update state here - we track deployment state, not AWS state
-                                                break
-                                        state.save_instances(instances)
+                        # Skip instances already recorded on an earlier attempt
+                        if public_ip and inst_id not in created_ids:
+                            now = datetime.now()
+                            created_ids.add(inst_id)
+                            created_instances.append(
+                                {
+                                    "id": inst_id,
+                                    "region": region,
+                                    "type": machine_type,
+                                    "state": "provisioned",  # Deployment state, not AWS state
+                                    "public_ip": public_ip,
+                                    "created": now.isoformat(),
+                                    "ami": ami_id,
+                                    "vpc_id": vpc_id,
+                                    "subnet_id": subnet_id,
+                                    "security_group_id": sg_id,
+                                }
+                            )
+                            update_status_func(
+                                key,
+                                "SUCCESS: Created",
+                                instance_id=inst_id,
+                                ip=public_ip,
+                                created=now.strftime("%Y-%m-%d %H:%M:%S"),
+                            )
+
+                            # Update the IP map for logging context
+                            with lock:
+                                instance_ip_map[inst_id] = public_ip
+
+                                # Update state with the public IP
+                                if state:
+                                    instances = state.load_instances()
+                                    for inst in instances:
+                                        if inst["id"] == inst_id:
+                                            inst["public_ip"] = public_ip
+                                            # Don't update state here - we track deployment state, not AWS state
+                                            break
+                                    state.save_instances(instances)
 
                 if len(created_instances) == len(instance_ids):
                     break
 
-                time.sleep(2)
+                if pause(2):
+                    interrupted = True
+                    break
 
             except Exception as e:
                 # Instances might not be ready yet, just continue
                 if attempt < 5:  # Only log after a few attempts
-                    time.sleep(2)
+                    if pause(2):
+                        interrupted = True
+                        break
                     continue
                 log_message(f"Error checking instance status: {e}")
 
-        # Mark any instances without IPs as errors
+        # Mark any instances without IPs as errors (or interrupted on shutdown)
+        missing_ip_status = "INTERRUPTED" if interrupted else "ERROR: No public IP"
         for i, inst_id in enumerate(instance_ids):
-            if not any(ci["id"] == inst_id for ci in created_instances):
+            if inst_id not in created_ids:
                 key = instance_keys[i]
                 update_status_func(
-                    key, "ERROR: No public IP", instance_id=inst_id, is_final=True
+                    key, missing_ip_status, instance_id=inst_id, is_final=True
                 )
 
         return created_instances
@@ -942,15 +949,15 @@ def create_instances_in_region_with_table(
             # AWS parameter validation errors often have the details after a colon
             if "Invalid" in error_msg:
                 # Try to extract the specific validation error
-                parts = error_msg.split("Invalid")
-                if len(parts) > 1:
-                    short_error = f"Invalid{parts[1][:40]}..."
+                _, found, invalid_detail = error_msg.partition("Invalid")
+                if found:
+                    short_error = f"Invalid{invalid_detail:.40}..."
                 else:
-                    short_error = error_msg[:50]
+                    short_error = f"{error_msg:.50}"
             else:
                 short_error = "Parameter validation failed"
         elif len(error_msg) > 50:
-            short_error = f"{error_msg[:47]}..."
+            short_error = f"{error_msg:.47}..."
         else:
             short_error = error_msg
 
@@ -959,6 +966,26 @@ def create_instances_in_region_with_table(
         return []
 
 
+# Table order of the displayed phases, and the markup style for each
+_PHASE_DISPLAY_ORDER = ("progress", "error", "success")
+_PHASE_STYLES = {"success": "bold green", "error": "bold red"}
+
+
+def _status_phase(status: str) -> str:
+    """Classify a creation status as skipped, error, success or progress.
+
+    Done once when a status is recorded rather than on every redraw.
+    Interrupted instances are final without succeeding, so count as errors.
+    """
+    if "SKIPPED" in status:
+        return "skipped"
+    if "ERROR" in status or "INTERRUPTED" in status:
+        return "error"
+    if "SUCCESS" in status:
+        return "success"
+    return "progress"
+
+
 def _run_cleanup_script() -> None:
     """Run the cleanup script to prevent file conflicts."""
     import subprocess
@@ -969,19 +996,38 @@ def _run_cleanup_script() -> None:
     )
     if cleanup_script.exists():
         try:
-            subprocess.run([str(cleanup_script)], check=False, capture_output=True)
+            subprocess.run(
+                [str(cleanup_script)],
+                check=False,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
         except Exception:
             pass  # Cleanup failures shouldn't block deployment
 
 
+def _lookup_creator() -> str:
+    """Get the caller's user name from STS for the CreatedBy tag."""
+    try:
+        caller_identity = get_caller_identity()
+        return cast(str, caller_identity.get("Arn", "unknown").rpartition("/")[2])
+    except Exception:
+        return "unknown"
+
+
 def cmd_create(
     config: SimpleConfig, state: SimpleStateManager, debug: bool = False
 ) -> None:
     """Create spot instances across configured regions with enhanced real-time progress tracking."""
-    # Run aggressive cleanup before deployment to prevent file conflicts
-    _run_cleanup_script()
-
-    if not check_aws_auth():
+    # Aggressive cleanup (to prevent file conflicts) and the creator lookup are
+    # independent of the auth check, so run them alongside it
+    with ThreadPoolExecutor(max_workers=2) as prerequisites:
+        cleanup = prerequisites.submit(_run_cleanup_script)
+        creator_lookup = prerequisites.submit(_lookup_creator)
+        authenticated = check_aws_auth()
+        cleanup.result()
+
+    if not authenticated:
         return
 
     # Initialize deployment_config as None (for legacy mode)
@@ -1088,20 +1134,15 @@ def cmd_create(
     # Generate unique deployment ID for this batch
     deployment_id = f"amauo-{timestamp}-{str(uuid.uuid4())[:8]}"
 
-    # Get AWS caller identity for creator tag
-    try:
-        sts = boto3.client("sts")
-        caller_identity = sts.get_caller_identity()
-        creator = caller_identity.get("Arn", "unknown").split("/")[
-            -1
-        ]  # Get username from ARN
-    except Exception:
-        creator = "unknown"
+    # AWS caller identity for creator tag, looked up alongside the auth check
+    creator = creator_lookup.result()
 
     # Create log buffer for in-memory storage (always enabled)
     from ..utils.logging import LogBuffer
 
     log_buffer = LogBuffer(maxlen=100)
+    # Any log line or status change means the live layout needs a redraw
+    display_changed = log_buffer.updated
 
     # Create console handler with instance IP map and log buffer
     instance_ip_map: dict[str, str] = {}
@@ -1117,16 +1158,14 @@ def cmd_create(
         rich_error("   This is required to inject your SSH key into instances.")
         return
 
-    # Check if public key exists
-    expanded_public_path = os.path.expanduser(public_key_path)
-    if not os.path.exists(expanded_public_path):
+    # Check if public key exists (SimpleConfig has already expanded the path)
+    if not os.path.exists(public_key_path):
         rich_error(f"Public SSH key not found at '{public_key_path}'")
         return
 
     # Check private key for SSH operations
     if private_key_path:
-        expanded_private_path = os.path.expanduser(private_key_path)
-        if not os.path.exists(expanded_private_path):
+        if not os.path.exists(private_key_path):
             rich_error(f"Private SSH key not found at '{private_key_path}'")
             return
     else:
@@ -1160,14 +1199,15 @@ def cmd_create(
         rich_warning("No instances configured to be created.")
         return
 
-    # Show deployment plan
-    rich_print(
+    # Show deployment plan in one write
+    plan_lines = [
         f"\n[green]Planning to create {total_instances_to_create} instances across {len(region_instance_map)} regions:[/green]"
-    )
+    ]
     for region, count in region_instance_map.items():
         region_cfg = config.region_config(region)
         instance_type = region_cfg.get("machine_type", "t3.medium")
-        rich_print(f"  • {region}: {count} × {instance_type}")
+        plan_lines.append(f"  • {region}: {count} × {instance_type}")
+    rich_print("\n".join(plan_lines))
 
     rich_print("\n[dim]Preparing deployment resources...[/dim]")
 
@@ -1188,23 +1228,30 @@ def cmd_create(
                 "region": region,
                 "instance_id": "pending...",
                 "status": "WAIT: Starting...",
+                "phase": "progress",
                 "upload_status": "-",
                 "type": instance_type,
                 "public_ip": "pending...",
                 "created": "pending...",
             }
 
+    # Keys are fixed once initialized, so sort them once rather than per redraw
+    sorted_keys = sorted(creation_status)
+
+    # Debug log panel text, re-read only when the file's size or mtime changes
+    log_tail_cache: dict[str, Any] = {"signature": None, "content": ""}
+
     def generate_layout() -> Any:
         # Count active (non-skipped) instances
         active_count = sum(
-            1 for item in creation_status.values() if "SKIPPED" not in item["status"]
+            1 for item in creation_status.values() if item["phase"] != "skipped"
         )
 
         # Count completed instances (SUCCESS or ERROR)
         completed_count = sum(
             1
             for item in creation_status.values()
-            if "SUCCESS" in item["status"] or "ERROR" in item["status"]
+            if item["phase"] in ("success", "error")
         )
 
         # Calculate progress percentage
@@ -1222,29 +1269,23 @@ def cmd_create(
             padding=(0, 1),
         )
 
-        sorted_items = sorted(creation_status.items(), key=lambda x: x[0])
+        sorted_items = [(key, creation_status[key]) for key in sorted_keys]
 
         # Limit table rows to prevent pushing log panel off screen
         # Show priority: in-progress, then errors, then success (changed order per summary)
-        error_items = []
-        progress_items = []
-        success_items = []
-
+        items_by_phase: dict[str, list[tuple[str, dict[str, Any]]]] = {
+            phase: [] for phase in _PHASE_DISPLAY_ORDER
+        }
         for key, item in sorted_items:
-            status = item["status"]
-            # Don't show skipped instances in the table
-            if "SKIPPED" in status:
-                continue
-
-            if "ERROR" in status:
-                error_items.append((key, item))
-            elif "SUCCESS" in status:
-                success_items.append((key, item))
-            else:
-                progress_items.append((key, item))
+            # Skipped instances aren't a display phase, so they're left out
+            bucket = items_by_phase.get(item["phase"])
+            if bucket is not None:
+                bucket.append((key, item))
 
         # Combine in priority order: in-progress → errors → completed (keep active visible)
-        all_items = progress_items + error_items + success_items
+        all_items = [
+            entry for phase in _PHASE_DISPLAY_ORDER for entry in items_by_phase[phase]
+        ]
 
         # Apply 20-row limit with overflow summary
         MAX_ROWS = 20
@@ -1253,13 +1294,8 @@ def cmd_create(
 
         for _key, item in displayed_items:
             status = item["status"]
-
-            if "SUCCESS" in status:
-                status_style = f"[bold green]{status}[/bold green]"
-            elif "ERROR" in status:
-                status_style = f"[bold red]{status}[/bold red]"
-            else:
-                status_style = status
+            style = _PHASE_STYLES.get(item["phase"])
+            status_style = f"[{style}]{status}[/{style}]" if style else status
 
             add_instance_row(
                 table,
@@ -1276,10 +1312,10 @@ def cmd_create(
         if overflow_count > 0:
             # Count overflow by status
             overflow_deployed = sum(
-                1 for _, item in all_items[MAX_ROWS:] if "SUCCESS" in item["status"]
+                1 for _, item in all_items[MAX_ROWS:] if item["phase"] == "success"
             )
             overflow_errors = sum(
-                1 for _, item in all_items[MAX_ROWS:] if "ERROR" in item["status"]
+                1 for _, item in all_items[MAX_ROWS:] if item["phase"] == "error"
             )
             overflow_pending = overflow_count - overflow_deployed - overflow_errors
 
@@ -1313,11 +1349,16 @@ def cmd_create(
         if log_filename:
             # Debug mode: read from file
             try:
-                with open(log_filename) as f:
+                st = os.stat(log_filename)
+                signature = (st.st_size, st.st_mtime_ns)
+                if signature != log_tail_cache["signature"]:
                     # Read last 10 lines for the log panel
-                    lines = [line.rstrip() for line in f.readlines()[-10:]]
-                    log_content = "\n".join(lines)
-            except (OSError, FileNotFoundError):
+                    log_tail_cache["content"] = "\n".join(
+                        read_log_tail(log_filename, 10)
+                    )
+                    log_tail_cache["signature"] = signature
+                log_content = log_tail_cache["content"]
+            except OSError:
                 log_content = "Log file not available yet..."
             log_title = f"[dim]Log: {log_filename} • amauo v{__version__}[/dim]"
         else:
@@ -1354,6 +1395,7 @@ def cmd_create(
         with lock:
             if key in creation_status:
                 creation_status[key]["status"] = status
+                creation_status[key]["phase"] = _status_phase(status)
                 if instance_id:
                     creation_status[key]["instance_id"] = instance_id
                 if ip:
@@ -1366,6 +1408,7 @@ def cmd_create(
                 log_ip = ip if ip else "N/A"
                 log_id = instance_id if instance_id else key
                 logger.info(f"[{log_id} @ {log_ip}] {status}")
+        display_changed.set()
         return True
 
     # Set up graceful shutdown handling
@@ -1382,17 +1425,41 @@ def cmd_create(
                 for _key, item in creation_status.items():
                     if "Waiting" in item["status"] or "Creating" in item["status"]:
                         item["status"] = "INTERRUPTED"
+                        item["phase"] = _status_phase("INTERRUPTED")
 
         shutdown_ctx.add_cleanup(cleanup_on_shutdown)
 
+        # Redraws are driven by status and log changes, not a refresh timer
         with Live(
             generate_layout(),
-            refresh_per_second=2,
+            auto_refresh=False,
             console=console,
             screen=False,
             redirect_stdout=True,
             redirect_stderr=True,
         ) as live:
+            # Set when the current phase's workers finish (or on shutdown) so
+            # the display loop exits without sitting out another redraw tick
+            phase_done = threading.Event()
+            shutdown_ctx.add_cleanup(phase_done.set)
+
+            def finish_phase() -> None:
+                phase_done.set()
+                display_changed.set()
+
+            def redraw_if_pending() -> bool:
+                """Redraw only if something changed since the last redraw."""
+                if not display_changed.is_set():
+                    return False
+                display_changed.clear()
+                live.update(generate_layout(), refresh=True)
+                return True
+
+            def refresh_if_changed() -> None:
+                """Wait briefly for a status or log change, then redraw."""
+                if display_changed.wait(timeout=0.25) and redraw_if_pending():
+                    # Cap redraws at four per second, waking early when done
+                    phase_done.wait(0.25)
 
             def create_region_instances(region: str, count: int) -> None:
                 try:
@@ -1415,6 +1482,7 @@ def cmd_create(
                         creator,
                         state,
                         deployment_config,
+                        shutdown_ctx,
                     )
                     with lock:
                         all_instances.extend(instances)
@@ -1428,23 +1496,24 @@ def cmd_create(
                     executor.submit(create_region_instances, r, c)
                     for r, c in region_instance_map.items()
                 ]
-                while (
-                    any(f.running() for f in futures)
-                    and not shutdown_ctx.shutdown_requested
-                ):
-                    live.update(generate_layout())
-                    time.sleep(0.25)
 
-            live.update(generate_layout())  # Final update after creation phase
+                def on_region_done(_future: Any) -> None:
+                    if all(f.done() for f in futures):
+                        finish_phase()
 
-            if all_instances and not shutdown_ctx.shutdown_requested:
-                # Status will be shown in the layout, not printed separately
-                live.update(generate_layout())
+                for future in futures:
+                    future.add_done_callback(on_region_done)
+                while not phase_done.is_set():
+                    refresh_if_changed()
+
+            # Final update after creation phase
+            redraw_if_pending()
 
+            if all_instances and not shutdown_ctx.shutdown_requested:
                 # Run post-creation setup with live display updates
                 # post_creation_setup runs in ThreadPoolExecutor, so we need
                 # to keep updating the Live display while it runs
-                setup_complete = threading.Event()
+                phase_done.clear()
 
                 def run_setup() -> None:
                     try:
@@ -1458,7 +1527,7 @@ def cmd_create(
                             shared_tarball_path,
                         )
                     finally:
-                        setup_complete.set()
+                        finish_phase()
 
                 setup_thread = threading.Thread(
                     target=run_setup, name="PostSetup", daemon=True
@@ -1466,12 +1535,11 @@ def cmd_create(
                 setup_thread.start()
 
                 # Keep updating display while setup runs
-                while not setup_complete.is_set():
-                    live.update(generate_layout())
-                    setup_complete.wait(timeout=0.5)
+                while not phase_done.is_set() and not shutdown_ctx.shutdown_requested:
+                    refresh_if_changed()
 
                 # Final update after setup completes
-                live.update(generate_layout())
+                redraw_if_pending()
             elif not all_instances:
                 rich_error("No instances were successfully created.")
             else:
@@ -1482,12 +1550,12 @@ def cmd_create(
 
     # Count skipped regions
     skipped_count = sum(
-        1 for item in creation_status.values() if "SKIPPED" in item["status"]
+        1 for item in creation_status.values() if item["phase"] == "skipped"
     )
     if skipped_count > 0:
         skipped_regions = set()
         for _key, item in creation_status.items():
-            if "SKIPPED" in item["status"]:
+            if item["phase"] == "skipped":
                 skipped_regions.add(item["region"])
         if skipped_regions:
             rich_warning(
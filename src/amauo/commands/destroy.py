@@ -1,11 +1,14 @@
 """Destroy command with full Rich UI and concurrent operations."""
 
+import bisect
+import hashlib
 import os
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from datetime import datetime
 from logging import Logger
 from threading import Lock
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from rich.console import Console
 from rich.layout import Layout
@@ -15,11 +18,23 @@ from rich.table import Table
 
 from ..core.config import SimpleConfig
 from ..core.state import SimpleStateManager
-from ..utils.aws import check_aws_auth
+from ..utils.aws import (
+    check_aws_auth,
+    default_cache_dir,
+    get_caller_identity,
+    load_cache,
+    save_cache,
+)
 from ..utils.logging import setup_logger
 from ..utils.shutdown_handler import ShutdownContext
 from ..utils.ui_manager import UIManager
 
+# Minimum time between rebuilds of the live destroy layout
+REDRAW_INTERVAL_SECONDS = 0.25
+
+# How long a clean orphan scan lets repeated destroys skip rescanning AWS
+ORPHAN_SCAN_TTL_SECONDS = 30
+
 
 class DestroyManager:
     """Manages instance destruction with live Rich updates."""
@@ -38,7 +53,9 @@ class DestroyManager:
         self.logger: Optional[Logger] = None
         self.status_lock = Lock()
         self.instance_status: dict[str, dict[str, Any]] = {}
-        self.start_time = datetime.now()
+        # (region, instance_id) pairs kept sorted as instances first appear
+        self._display_order: list[tuple[str, str]] = []
+        self.start_time = time.monotonic()
         self.ui_manager = UIManager(console)
 
     def initialize_logger(self) -> Optional[str]:
@@ -53,6 +70,7 @@ class DestroyManager:
     ) -> None:
         """Thread-safe status update."""
         with self.status_lock:
+            self._track_instance(instance_id, region)
             self.instance_status[instance_id] = {
                 "region": region,
                 "status": status,
@@ -62,18 +80,20 @@ class DestroyManager:
             if self.logger:
                 self.logger.info(f"[{instance_id}] {status} {detail}")
 
+    def _track_instance(self, instance_id: str, region: str) -> None:
+        """Insert a newly seen instance into the sorted display order."""
+        if instance_id not in self.instance_status:
+            bisect.insort(self._display_order, (region, instance_id))
+
     def create_status_table(self) -> Table:
         """Create the status table for display."""
         table = self.ui_manager.create_instance_table(
             title="Instance Destruction Status", header_style="bold red"
         )
 
-        # Sort by region for consistent display
-        sorted_instances = sorted(
-            self.instance_status.items(), key=lambda x: (x[1]["region"], x[0])
-        )
-
-        for instance_id, info in sorted_instances:
+        # Rows are kept sorted by region on insert for consistent display
+        for _, instance_id in self._display_order:
+            info = self.instance_status[instance_id]
             # Use UI manager to format status
             status_display = self.ui_manager.format_status(
                 info["status"], info["detail"]
@@ -94,7 +114,7 @@ class DestroyManager:
 
     def create_summary_panel(self) -> Panel:
         """Create summary panel showing progress."""
-        elapsed = (datetime.now() - self.start_time).total_seconds()
+        elapsed = time.monotonic() - self.start_time
 
         # Count statuses
         total = len(self.instance_status)
@@ -113,6 +133,76 @@ class DestroyManager:
 
         return self.ui_manager.create_progress_panel("Summary", content)
 
+    def _orphan_scan_marker(self, regions: list[str]) -> Optional[str]:
+        """Path of the marker recording a clean scan of these regions.
+
+        Keyed by the caller's ARN rather than AWS_PROFILE, so credentials from
+        the environment or SSO never share a marker. None when the identity is
+        unknown, in which case the scan always runs.
+        """
+        try:
+            arn = get_caller_identity()["Arn"]
+        except Exception:
+            return None
+        state_path = os.path.abspath(self.state.state_file)
+        scope = f"{arn}:{state_path}:{','.join(sorted(regions))}"
+        digest = hashlib.sha1(scope.encode()).hexdigest()[:12]
+        return os.path.join(default_cache_dir(), f"orphan_scan_clean_{digest}.json")
+
+    def _newest_recorded_launch(self) -> float:
+        """Latest launch time in the state file (its mtime bounds any write)."""
+        try:
+            newest = os.path.getmtime(self.state.state_file)
+        except OSError:
+            newest = 0.0
+        for instance in self.state.load_instances():
+            try:
+                created = datetime.fromisoformat(instance["created"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                continue
+            newest = max(newest, created)
+        return newest
+
+    def _recent_clean_scan(self, marker: Optional[str]) -> bool:
+        """Check whether a clean scan started moments ago.
+
+        The marker records when the scan began, and only counts while that is
+        later than every launch recorded in local state and the last write to
+        the state file, so instances created since are never missed.
+        """
+        cached = load_cache(marker) if marker else None
+        scan_started = cached.get("scan_started") if cached else None
+        if not isinstance(scan_started, (int, float)):
+            return False
+        if time.time() - scan_started >= ORPHAN_SCAN_TTL_SECONDS:
+            return False
+        return scan_started > self._newest_recorded_launch()
+
+    @staticmethod
+    def _describe_managed_instances(region: str) -> dict[str, Any]:
+        """Describe live instances in a region carrying our ManagedBy tag."""
+        from ..utils.aws_manager import AWSResourceManager
+
+        # Look for instances with our tags (both old and new tag formats)
+        response = AWSResourceManager(region).ec2.describe_instances(
+            Filters=[
+                {
+                    "Name": "tag:ManagedBy",
+                    "Values": [
+                        "Amauo",
+                        "amauo",
+                        "amauo",
+                        "aws-amauo",
+                    ],
+                },
+                {
+                    "Name": "instance-state-name",
+                    "Values": ["running", "pending", "stopping", "stopped"],
+                },
+            ]
+        )
+        return cast(dict[str, Any], response)
+
     def _check_aws_orphaned_instances(self) -> None:
         """Check AWS for any orphaned spot instances that aren't in state file."""
         try:
@@ -120,93 +210,100 @@ class DestroyManager:
 
             regions_checked = 0
             orphaned_found = 0
+            scan_failed = False
 
             # Get all regions
             regions = self.config.regions()
+            marker = self._orphan_scan_marker(regions)
+            if self._recent_clean_scan(marker):
+                self.console.print(
+                    f"[dim]No orphaned instances found in the last "
+                    f"{ORPHAN_SCAN_TTL_SECONDS}s, skipping scan[/dim]"
+                )
+                return
+            scan_started = time.time()
             self.console.print(
                 f"[dim]Scanning {len(regions)} regions: {', '.join(regions)}[/dim]"
             )
 
-            # Check each region from config
-            for region in regions:
-                regions_checked += 1
-
-                self.console.print(f"[dim]  • Checking {region}...[/dim]", end="")
-
-                try:
-                    aws_manager = AWSResourceManager(region)
-
-                    # Look for instances with our tags (both old and new tag formats)
-                    response = aws_manager.ec2.describe_instances(
-                        Filters=[
-                            {
-                                "Name": "tag:ManagedBy",
-                                "Values": [
-                                    "Amauo",
-                                    "amauo",
-                                    "amauo",
-                                    "aws-amauo",
-                                ],
-                            },
-                            {
-                                "Name": "instance-state-name",
-                                "Values": ["running", "pending", "stopping", "stopped"],
-                            },
-                        ]
-                    )
-
-                    found_in_region = 0
-                    for reservation in response.get("Reservations", []):
-                        for instance in reservation.get("Instances", []):
-                            orphaned_found += 1
-                            found_in_region += 1
-                            instance_id = instance.get("InstanceId", "Unknown")
-                            state = instance.get("State", {}).get("Name", "unknown")
-                            public_ip = instance.get("PublicIpAddress", "N/A")
-
-                            if found_in_region == 1:
-                                self.console.print("")  # New line after region check
-
-                            self.console.print(
-                                f"[yellow]    ⚠️  Found orphaned instance: "
-                                f"{instance_id} ({state}) - IP: {public_ip}[/yellow]"
-                            )
+            # Region lookups are independent network calls, so issue them all
+            # at once; results are still reported in config order below
+            with ThreadPoolExecutor(
+                max_workers=max(1, min(8, len(regions))),
+                thread_name_prefix="OrphanScan",
+            ) as executor:
+                lookups = {
+                    region: executor.submit(self._describe_managed_instances, region)
+                    for region in regions
+                }
+
+                # Check each region from config
+                for region in regions:
+                    regions_checked += 1
+
+                    self.console.print(f"[dim]  • Checking {region}...[/dim]", end="")
+
+                    try:
+                        response = lookups[region].result()
+                        aws_manager = AWSResourceManager(region)
+
+                        found_in_region = 0
+                        for reservation in response.get("Reservations", []):
+                            for instance in reservation.get("Instances", []):
+                                orphaned_found += 1
+                                found_in_region += 1
+                                instance_id = instance.get("InstanceId", "Unknown")
+                                state = instance.get("State", {}).get("Name", "unknown")
+                                public_ip = instance.get("PublicIpAddress", "N/A")
+
+                                if found_in_region == 1:
+                                    # New line after region check
+                                    self.console.print("")
 
-                            # Terminate the orphaned instance
-                            if state not in ["terminated", "terminating"]:
                                 self.console.print(
-                                    f"[dim]    → Terminating {instance_id}...[/dim]"
+                                    f"[yellow]    ⚠️  Found orphaned instance: "
+                                    f"{instance_id} ({state}) - IP: {public_ip}[/yellow]"
                                 )
-                                try:
-                                    aws_manager.ec2.terminate_instances(
-                                        InstanceIds=[instance_id]
-                                    )
+
+                                # Terminate the orphaned instance
+                                if state not in ["terminated", "terminating"]:
                                     self.console.print(
-                                        f"[green]    ✓ Terminated {instance_id}[/green]"
+                                        f"[dim]    → Terminating {instance_id}...[/dim]"
                                     )
-                                    if self.logger:
-                                        self.logger.info(
-                                            f"Terminated orphaned instance {instance_id} in {region}"
+                                    try:
+                                        aws_manager.ec2.terminate_instances(
+                                            InstanceIds=[instance_id]
                                         )
-                                except Exception as e:
-                                    self.console.print(
-                                        f"[red]    ✗ Failed to terminate {instance_id}[/red]"
-                                    )
-                                    if self.logger:
-                                        self.logger.error(
-                                            f"Failed to terminate orphaned instance {instance_id}: {e}"
+                                        self.console.print(
+                                            f"[green]    ✓ Terminated {instance_id}[/green]"
+                                        )
+                                        if self.logger:
+                                            self.logger.info(
+                                                f"Terminated orphaned instance {instance_id} in {region}"
+                                            )
+                                    except Exception as e:
+                                        self.console.print(
+                                            f"[red]    ✗ Failed to terminate {instance_id}[/red]"
                                         )
+                                        if self.logger:
+                                            self.logger.error(
+                                                f"Failed to terminate orphaned instance {instance_id}: {e}"
+                                            )
 
-                    if found_in_region == 0:
-                        self.console.print(" [green]✓[/green]")
+                        if found_in_region == 0:
+                            self.console.print(" [green]✓[/green]")
 
-                except Exception as e:
-                    self.console.print(" [red]✗[/red]")
-                    if self.logger:
-                        self.logger.debug(f"Error checking region {region}: {e}")
+                    except Exception as e:
+                        scan_failed = True
+                        self.console.print(" [red]✗[/red]")
+                        if self.logger:
+                            self.logger.debug(f"Error checking region {region}: {e}")
 
             self.console.print(f"[dim]Checked {regions_checked} regions[/dim]")
 
+            if marker and orphaned_found == 0 and not scan_failed:
+                save_cache(marker, {"scan_started": scan_started})
+
             if orphaned_found > 0:
                 self.console.print(
                     f"\n[green]✅ Found and terminated {orphaned_found} orphaned instances[/green]"
@@ -227,8 +324,8 @@ class DestroyManager:
             aws_manager = AWSResourceManager(region)
             ec2 = aws_manager.ec2
 
-            # First check if instance exists
-            instance_state = aws_manager.get_instance_state(instance_id)
+            # First check if instance exists, noting its VPC for cleanup later
+            instance_state, vpc_id = aws_manager.get_instance_state_and_vpc(instance_id)
 
             if instance_state in ["terminated", "terminating", "not-found"]:
                 self.update_status(instance_id, region, "✓ Terminated", "Already gone")
@@ -245,14 +342,15 @@ class DestroyManager:
             # Step 3: Check for VPC
             self.update_status(instance_id, region, "⏳ Checking VPC...")
 
-            # Get instance details to find VPC
             try:
-                response = ec2.describe_instances(InstanceIds=[instance_id])
-                vpc_id = None
-                for reservation in response.get("Reservations", []):
-                    for inst in reservation.get("Instances", []):
-                        vpc_id = inst.get("VpcId")
-                        break
+                if instance_state == "error":
+                    # The first lookup failed, so look up the VPC again
+                    # rather than skipping its cleanup
+                    response = ec2.describe_instances(InstanceIds=[instance_id])
+                    for reservation in response.get("Reservations", []):
+                        for inst in reservation.get("Instances", []):
+                            vpc_id = inst.get("VpcId")
+                            break
 
                 if vpc_id:
                     # Check if it's a dedicated VPC
@@ -280,8 +378,15 @@ class DestroyManager:
                                 )
                             return True
 
-            except Exception:
-                pass
+            except Exception as e:
+                if self.logger:
+                    self.logger.warning(
+                        f"VPC cleanup skipped for {instance_id}: lookup failed ({e})"
+                    )
+                self.update_status(
+                    instance_id, region, "✓ Complete", "VPC cleanup skipped"
+                )
+                return True
 
             # No dedicated VPC, just mark as complete
             self.update_status(instance_id, region, "✓ Complete", "")
@@ -292,7 +397,7 @@ class DestroyManager:
             if "InsufficientInstanceCapacity" in error_msg:
                 error_msg = "No capacity"
             elif len(error_msg) > 30:
-                error_msg = error_msg[:30] + "..."
+                error_msg = f"{error_msg:.30}..."
 
             self.update_status(instance_id, region, "✗ Failed", error_msg)
             return False
@@ -343,6 +448,7 @@ class DestroyManager:
 
         # Initialize status for all instances
         for instance in instances:
+            self._track_instance(instance["id"], instance["region"])
             self.instance_status[instance["id"]] = {
                 "region": instance["region"],
                 "status": "⏳ Queued",
@@ -387,9 +493,10 @@ class DestroyManager:
 
             shutdown_ctx.add_cleanup(cleanup_on_shutdown)
 
+            # Redrawn only as instances finish, not on a refresh timer
             with Live(
                 generate_layout(),
-                refresh_per_second=4,
+                auto_refresh=False,
                 console=self.console,
                 screen=True,
                 redirect_stdout=False,
@@ -404,33 +511,52 @@ class DestroyManager:
                         if not shutdown_ctx.shutdown_requested  # Don't submit new tasks if shutting down
                     }
 
-                    # Process as they complete
-                    for future in as_completed(future_to_instance):
+                    # Process as they complete, waking at least once per
+                    # redraw interval so batched completions are drawn promptly
+                    pending = set(future_to_instance)
+                    last_redraw = 0.0
+                    redraw_pending = False
+                    while pending:
                         if shutdown_ctx.shutdown_requested:
                             # Cancel remaining futures
-                            for f in future_to_instance:
-                                if not f.done():
-                                    f.cancel()
+                            for f in pending:
+                                f.cancel()
                             break
 
-                        instance = future_to_instance[future]
-                        try:
-                            success = future.result()
-                            # Always remove from state if terminated or not found
-                            if success or "Terminated" in self.instance_status.get(
-                                instance["id"], {}
-                            ).get("status", ""):
-                                self.state.remove_instance(instance["id"])
-                        except Exception as e:
-                            # Still try to remove from state if instance doesn't exist
-                            if "InvalidInstanceID" in str(e):
-                                self.state.remove_instance(instance["id"])
-
-                        # Update display
-                        live.update(generate_layout())
-
-                # Final update
-                live.update(generate_layout())
+                        done, pending = wait(
+                            pending,
+                            timeout=REDRAW_INTERVAL_SECONDS,
+                            return_when=FIRST_COMPLETED,
+                        )
+                        for future in done:
+                            instance = future_to_instance[future]
+                            try:
+                                success = future.result()
+                                # Always remove from state if terminated or not found
+                                if success or "Terminated" in self.instance_status.get(
+                                    instance["id"], {}
+                                ).get("status", ""):
+                                    self.state.remove_instance(instance["id"])
+                            except Exception as e:
+                                # Still try to remove from state if instance doesn't exist
+                                if "InvalidInstanceID" in str(e):
+                                    self.state.remove_instance(instance["id"])
+                            redraw_pending = True
+
+                        # Update display, batching completions that arrive
+                        # faster than the redraw interval
+                        now = time.monotonic()
+                        if (
+                            redraw_pending
+                            and now - last_redraw >= REDRAW_INTERVAL_SECONDS
+                        ):
+                            live.update(generate_layout(), refresh=True)
+                            last_redraw = now
+                            redraw_pending = False
+
+                # Final update, unless the last completion was already drawn
+                if redraw_pending or shutdown_ctx.shutdown_requested:
+                    live.update(generate_layout(), refresh=True)
 
         # Show summary
         total = len(instances)
@@ -1,23 +1,121 @@
 """List command for spot-deployer - shows instances from local state."""
 
-import boto3
-from botocore.exceptions import ClientError
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from typing import Any
 
+from ..core.constants import (
+    LIVE_INSTANCE_STATES,
+    MAX_REGION_WORKERS,
+    MAX_STATUS_INSTANCE_IDS,
+)
 from ..core.state import SimpleStateManager
 from ..utils.display import RICH_AVAILABLE, console, rich_print
 from ..utils.tables import add_instance_row, create_instance_table
 
+# User-friendly labels for internal deployment states
+_STATE_LABELS = {
+    "deployed": "✅ Deployed",
+    "provisioned": "⏳ Provisioning",
+    "complete": "✅ Deployed",
+}
 
-def get_instance_status(instance_id: str, region: str) -> str:
-    """Get the current status of an instance from AWS."""
-    try:
-        ec2 = boto3.client("ec2", region_name=region)
-        response = ec2.describe_instances(InstanceIds=[instance_id])
-        if response["Reservations"] and response["Reservations"][0]["Instances"]:
-            return response["Reservations"][0]["Instances"][0]["State"]["Name"]
-    except (ClientError, KeyError):
-        pass
-    return "unknown"
+
+def _describe_live_states(ec2: Any, instance_ids: list[str]) -> dict[str, str]:
+    """Look up live instance states with DescribeInstances filters.
+
+    Slower than DescribeInstanceStatus, but tolerates IDs that AWS no longer
+    knows about.
+    """
+    states: dict[str, str] = {}
+    response = ec2.describe_instances(
+        Filters=[
+            {"Name": "instance-id", "Values": instance_ids},
+            {"Name": "instance-state-name", "Values": LIVE_INSTANCE_STATES},
+        ]
+    )
+    for reservation in response.get("Reservations", []):
+        for instance in reservation.get("Instances", []):
+            instance_id = instance.get("InstanceId")
+            if instance_id:
+                states[instance_id] = instance.get("State", {}).get("Name", "unknown")
+    return states
+
+
+def get_instance_states_in_region(
+    region: str, instance_ids: list[str]
+) -> dict[str, str]:
+    """Get the current state of several instances in one region from AWS.
+
+    Uses DescribeInstanceStatus, whose per-instance records are far smaller
+    than full DescribeInstances payloads. Only live instances are requested;
+    any ID that is not returned has gone away and is reported as terminated.
+    """
+    if not instance_ids:
+        return {}
+
+    from botocore.exceptions import ClientError
+
+    from ..utils.aws_manager import get_ec2_client
+
+    ec2 = get_ec2_client(region)
+    states: dict[str, str] = {}
+    for start in range(0, len(instance_ids), MAX_STATUS_INSTANCE_IDS):
+        chunk = instance_ids[start : start + MAX_STATUS_INSTANCE_IDS]
+        try:
+            response = ec2.describe_instance_status(
+                InstanceIds=chunk,
+                IncludeAllInstances=True,
+                Filters=[
+                    {"Name": "instance-state-name", "Values": LIVE_INSTANCE_STATES}
+                ],
+            )
+        except ClientError as e:
+            # Explicit IDs fail as a whole once any of them has been purged
+            if e.response.get("Error", {}).get("Code") != "InvalidInstanceID.NotFound":
+                raise
+            states.update(_describe_live_states(ec2, chunk))
+            continue
+
+        for status in response.get("InstanceStatuses", []):
+            instance_id = status.get("InstanceId")
+            if instance_id:
+                states[instance_id] = status.get("InstanceState", {}).get(
+                    "Name", "unknown"
+                )
+
+    for instance_id in instance_ids:
+        states.setdefault(instance_id, "terminated")
+    return states
+
+
+def refresh_instance_states(instances: list[dict[str, Any]]) -> dict[str, str]:
+    """Query AWS for the state of all instances, one request per region."""
+    result_map: dict[str, str] = {}
+    by_region: dict[str, list[str]] = {}
+    for instance in instances:
+        by_region.setdefault(instance["region"], []).append(instance["id"])
+
+    if not by_region:
+        return result_map
+
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_REGION_WORKERS, len(by_region))
+    ) as executor:
+        future_to_region: dict[Future[dict[str, str]], str] = {
+            executor.submit(get_instance_states_in_region, region, ids): region
+            for region, ids in by_region.items()
+        }
+
+        for future in as_completed(future_to_region):
+            region = future_to_region[future]
+            try:
+                result_map.update(future.result())
+            except Exception:
+                # Mark the region's instances as unresolved
+                for instance_id in by_region[region]:
+                    result_map[instance_id] = "error"
+
+    return result_map
 
 
 def cmd_list(state: SimpleStateManager, refresh: bool = False) -> None:
@@ -39,20 +137,19 @@ def cmd_list(state: SimpleStateManager, refresh: bool = False) -> None:
         # Create table with proper title
         table = create_instance_table(title="Instances from Local State")
 
+        # Fetch live states in one batched request per region
+        live_states = refresh_instance_states(instances) if refresh else {}
+
         # Add all instances to table
         for instance in instances:
             # Get status - either from AWS or show as unknown
             if refresh:
-                status = get_instance_status(instance["id"], instance["region"])
+                status = live_states.get(instance["id"], "not-found")
+                instance["state"] = status
             else:
                 status = instance.get("state", "unknown")
                 # Translate internal states to user-friendly status
-                if status == "deployed":
-                    status = "✅ Deployed"
-                elif status == "provisioned":
-                    status = "⏳ Provisioning"
-                elif status == "complete":
-                    status = "✅ Deployed"
+                status = _STATE_LABELS.get(status, status)
 
             add_instance_row(
                 table,
@@ -80,10 +177,9 @@ def cmd_list(state: SimpleStateManager, refresh: bool = False) -> None:
         )
     else:
         # Simple text output
-        print(f"\nInstances ({len(instances)} total):")
-        print("-" * 60)
-        for instance in instances:
-            print(
-                f"  • {instance['region']}: {instance['id']} - {instance.get('public_ip', 'pending')}"
-            )
-        print()
+        lines = [f"\nInstances ({len(instances)} total):", "-" * 60]
+        lines.extend(
+            f"  • {instance['region']}: {instance['id']} - {instance.get('public_ip', 'pending')}"
+            for instance in instances
+        )
+        print("\n".join(lines) + "\n")
@@ -1,16 +1,15 @@
 """Nuke command - finds and destroys ALL spot instances across all regions."""
 
+import functools
 from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from typing import Any
 
-from botocore.exceptions import ClientError
-
 from ..core.config import SimpleConfig
+from ..core.constants import MAX_REGION_WORKERS, MAX_TERMINATE_INSTANCE_IDS
 from ..core.state import SimpleStateManager
-from ..utils.aws import check_aws_auth
-from ..utils.display import console, rich_success
+from ..utils.display import Live, Table, console, rich_success
 
-# AWS regions to scan
+# Regions to scan when the enabled-region lookup is unavailable
 AWS_REGIONS = [
     "us-east-1",
     "us-east-2",
@@ -35,45 +34,70 @@ AWS_REGIONS = [
 ]
 
 
+@functools.cache
+def _enabled_regions() -> tuple[str, ...]:
+    """Get the regions enabled for this account, falling back to AWS_REGIONS.
+
+    Opt-in regions the account has not enabled only answer with
+    UnauthorizedOperation, so scanning them is wasted round trips.
+    """
+    try:
+        from ..utils.aws_manager import get_ec2_client
+
+        response = get_ec2_client("us-east-1").describe_regions(AllRegions=False)
+        regions = sorted(r["RegionName"] for r in response.get("Regions", []))
+        if regions:
+            return tuple(regions)
+    except Exception:
+        pass
+    return tuple(AWS_REGIONS)
+
+
 def find_spot_instances_in_region(region: str) -> list[dict[str, Any]]:
     """Find all spot instances in a specific region."""
+    from botocore.exceptions import ClientError
+
     try:
         from ..utils.aws_manager import AWSResourceManager
 
         aws_manager = AWSResourceManager(region)
         ec2 = aws_manager.ec2
 
-        # Find all instances with lifecycle=spot
-        response = ec2.describe_instances(
+        # Find all instances with lifecycle=spot, following every result page
+        paginator = ec2.get_paginator("describe_instances")
+        pages = paginator.paginate(
             Filters=[
                 {"Name": "instance-lifecycle", "Values": ["spot"]},
                 {
                     "Name": "instance-state-name",
                     "Values": ["pending", "running", "stopping", "stopped"],
                 },
-            ]
+            ],
+            # DescribeInstances caps MaxResults at 1000 per page
+            PaginationConfig={"PageSize": 1000},
         )
 
         instances: list[dict[str, Any]] = []
-        for reservation in response.get("Reservations", []):
-            for instance in reservation.get("Instances", []):
-                # Extract tags safely
-                tags_dict: dict[str, str] = {}
-                for tag in instance.get("Tags", []):
-                    if "Key" in tag and "Value" in tag:
-                        tags_dict[tag["Key"]] = tag["Value"]
-
-                instances.append(
-                    {
-                        "id": instance.get("InstanceId", "unknown"),
-                        "region": region,
-                        "state": instance.get("State", {}).get("Name", "unknown"),
-                        "type": instance.get("InstanceType", "unknown"),
-                        "public_ip": instance.get("PublicIpAddress", "N/A"),
-                        "launch_time": str(instance.get("LaunchTime", "unknown")),
-                        "tags": tags_dict,
-                    }
-                )
+        for page in pages:
+            for reservation in page.get("Reservations", []):
+                for instance in reservation.get("Instances", []):
+                    # Extract tags safely
+                    tags_dict: dict[str, str] = {}
+                    for tag in instance.get("Tags", []):
+                        if "Key" in tag and "Value" in tag:
+                            tags_dict[tag["Key"]] = tag["Value"]
+
+                    instances.append(
+                        {
+                            "id": instance.get("InstanceId", "unknown"),
+                            "region": region,
+                            "state": instance.get("State", {}).get("Name", "unknown"),
+                            "type": instance.get("InstanceType", "unknown"),
+                            "public_ip": instance.get("PublicIpAddress", "N/A"),
+                            "launch_time": str(instance.get("LaunchTime", "unknown")),
+                            "tags": tags_dict,
+                        }
+                    )
 
         return instances
     except ClientError as e:
@@ -89,38 +113,87 @@ def find_spot_instances_in_region(region: str) -> list[dict[str, Any]]:
 def terminate_instances_in_region(
     region: str, instance_ids: list[str]
 ) -> dict[str, str]:
-    """Terminate instances in a specific region."""
-    if not instance_ids:
-        return {}
+    """Terminate instances in a specific region.
 
-    try:
-        from ..utils.aws_manager import AWSResourceManager
+    IDs are sent in batches of at most MAX_TERMINATE_INSTANCE_IDS, so a
+    failed batch only marks its own instances as errored.
+    """
+    from ..utils.aws_manager import AWSResourceManager
 
-        aws_manager = AWSResourceManager(region)
-        ec2 = aws_manager.ec2
-
-        # Terminate instances
-        response = ec2.terminate_instances(InstanceIds=instance_ids)
+    aws_manager = AWSResourceManager(region)
+    results: dict[str, str] = {}
+    for start in range(0, len(instance_ids), MAX_TERMINATE_INSTANCE_IDS):
+        batch = instance_ids[start : start + MAX_TERMINATE_INSTANCE_IDS]
+        try:
+            ec2 = aws_manager.ec2
 
-        # Extract termination status
-        results: dict[str, str] = {}
-        for inst in response.get("TerminatingInstances", []):
-            instance_id = inst.get("InstanceId", "unknown")
-            current_state = inst.get("CurrentState", {})
-            state_name = current_state.get("Name", "unknown")
-            results[instance_id] = state_name
+            # Terminate instances
+            response = ec2.terminate_instances(InstanceIds=batch)
+
+            # Extract termination status
+            for inst in response.get("TerminatingInstances", []):
+                instance_id = inst.get("InstanceId", "unknown")
+                current_state = inst.get("CurrentState", {})
+                state_name = current_state.get("Name", "unknown")
+                results[instance_id] = state_name
+        except Exception as e:
+            # Return error status for all instances in the batch
+            results.update({inst_id: f"ERROR: {str(e)}" for inst_id in batch})
+
+    return results
+
+
+def _region_instance_lines(instances: list[dict[str, Any]]) -> list[str]:
+    """Format the spot instances found in a region with their tags."""
+    lines: list[str] = []
+    for inst in instances:
+        tags_str = ", ".join(f"{k}={v}" for k, v in inst["tags"].items() if k != "Name")
+        name_tag = inst["tags"].get("Name", "")
+        if name_tag:
+            name_str = f" [cyan]({name_tag})[/cyan]"
+        else:
+            name_str = ""
+
+        lines.append(
+            f"  • {inst['id']}{name_str} - {inst['type']} - "
+            f"{inst['state']} - {inst['public_ip']} - "
+            f"[dim]{inst['launch_time']}[/dim]"
+        )
+        if tags_str:
+            lines.append(f"    [dim]Tags: {tags_str}[/dim]")
 
-        return results
-    except Exception as e:
-        # Return error status for all instances
-        return {inst_id: f"ERROR: {str(e)}" for inst_id in instance_ids}
+    return lines
 
 
 def cmd_nuke(state: SimpleStateManager, config: SimpleConfig) -> None:
     """Find and destroy ALL spot instances across all AWS regions."""
-    if not check_aws_auth():
+    from ..utils.aws import check_aws_auth
+
+    regions = _enabled_regions()
+
+    # Start the region scans right away so they overlap with the STS auth
+    # check; nothing is terminated until auth has been confirmed
+    scan_executor = ThreadPoolExecutor(
+        max_workers=min(MAX_REGION_WORKERS, len(regions))
+    )
+    scan_future_to_region: dict[Future[list[dict[str, Any]]], str] = {
+        scan_executor.submit(find_spot_instances_in_region, region): region
+        for region in regions
+    }
+
+    # Stop the scans if auth fails or the check raises
+    auth_ok = False
+    try:
+        auth_ok = check_aws_auth()
+    finally:
+        if not auth_ok:
+            scan_executor.shutdown(wait=False, cancel_futures=True)
+    if not auth_ok:
         return
 
+    # Read local state once; it is pruned in memory after termination
+    local_instances = state.load_instances()
+
     console.print(
         "\n[bold red]🚨 NUCLEAR OPTION - DESTROY ALL SPOT INSTANCES 🚨[/bold red]\n"
     )
@@ -129,113 +202,95 @@ def cmd_nuke(state: SimpleStateManager, config: SimpleConfig) -> None:
     console.print("  • Terminate ALL spot instances found")
     console.print("  • This includes instances NOT managed by this tool\n")
 
-    # Phase 1: Scan all regions for spot instances
+    # Phase 1 and 2 run as a pipeline: each region's termination is submitted
+    # as soon as its scan completes, without waiting for the slowest region
     console.print(
         "\n[cyan]Phase 1: Scanning all AWS regions for spot instances...[/cyan]"
     )
-    console.print(f"[dim]Scanning {len(AWS_REGIONS)} regions in parallel...[/dim]\n")
+    console.print(f"[dim]Scanning {len(regions)} regions in parallel...[/dim]\n")
 
     all_instances: list[dict[str, Any]] = []
     region_errors: list[tuple[str, str]] = []
+    found_by_region: dict[str, list[dict[str, Any]]] = {}
+    termination_groups: dict[str, list[str]] = {}
     completed_regions = 0
 
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit all region scans
-        scan_future_to_region: dict[Future[list[dict[str, Any]]], str] = {
-            executor.submit(find_spot_instances_in_region, region): region
-            for region in AWS_REGIONS
-        }
+    # Scan progress is shown in one live table updated in place
+    scan_table = Table(show_header=True, header_style="bold", box=None)
+    scan_table.add_column("Progress", style="dim", no_wrap=True)
+    scan_table.add_column("Region", no_wrap=True)
+    scan_table.add_column("Result")
 
-        # Process results as they complete
-        for future in as_completed(scan_future_to_region):
-            region = scan_future_to_region[future]
-            completed_regions += 1
-            progress = f"[{completed_regions}/{len(AWS_REGIONS)}]"
+    terminated_ids: set[str] = set()
+    failed_count = 0
+    completed_terminations = 0
 
-            try:
-                instances = future.result()
-                if instances:
-                    all_instances.extend(instances)
-                    console.print(
-                        f"  {progress} [green]✓[/green] {region}: Found {len(instances)} spot instances"
+    terminate_executor = ThreadPoolExecutor(
+        max_workers=min(MAX_REGION_WORKERS, len(regions))
+    )
+    with scan_executor, terminate_executor:
+        terminate_future_to_region: dict[Future[dict[str, str]], str] = {}
+
+        # Process scan results as they complete and hand off to terminators
+        with Live(scan_table, console=console, refresh_per_second=8):
+            for future in as_completed(scan_future_to_region):
+                region = scan_future_to_region[future]
+                completed_regions += 1
+                progress = f"{completed_regions}/{len(regions)}"
+
+                try:
+                    instances = future.result()
+                except Exception as e:
+                    region_errors.append((region, str(e)))
+                    scan_table.add_row(progress, region, f"[red]✗[/red] Error - {e}")
+                    continue
+
+                if not instances:
+                    scan_table.add_row(
+                        progress, region, "[dim]✓ No spot instances[/dim]"
                     )
-                else:
-                    console.print(
-                        f"  {progress} [dim]✓[/dim] {region}: No spot instances"
+                    continue
+
+                all_instances.extend(instances)
+                found_by_region[region] = instances
+                instance_ids = [inst["id"] for inst in instances]
+                termination_groups[region] = instance_ids
+                terminate_future_to_region[
+                    terminate_executor.submit(
+                        terminate_instances_in_region, region, instance_ids
                     )
-            except Exception as e:
-                region_errors.append((region, str(e)))
-                console.print(f"  {progress} [red]✗[/red] {region}: Error - {str(e)}")
+                ] = region
 
-    if region_errors:
-        console.print(
-            f"\n[yellow]⚠️  Failed to scan {len(region_errors)} regions[/yellow]"
-        )
-
-    if not all_instances:
-        rich_success("No spot instances found in any region!")
-        return
-
-    # Display found instances
-    console.print(f"\n[bold]Found {len(all_instances)} spot instances:[/bold]\n")
-
-    # Group by region for display
-    by_region: dict[str, list[dict[str, Any]]] = {}
-    for inst in all_instances:
-        region = inst["region"]
-        if region not in by_region:
-            by_region[region] = []
-        by_region[region].append(inst)
-
-    for region, instances in sorted(by_region.items()):
-        console.print(f"\n[bold]{region}:[/bold]")
-        for inst in instances:
-            tags_str = ", ".join(
-                f"{k}={v}" for k, v in inst["tags"].items() if k != "Name"
-            )
-            name_tag = inst["tags"].get("Name", "")
-            if name_tag:
-                name_str = f" [cyan]({name_tag})[/cyan]"
-            else:
-                name_str = ""
+                scan_table.add_row(
+                    progress,
+                    region,
+                    f"[green]✓[/green] Found {len(instances)} spot instances",
+                )
 
+        if region_errors:
             console.print(
-                f"  • {inst['id']}{name_str} - {inst['type']} - "
-                f"{inst['state']} - {inst['public_ip']} - "
-                f"[dim]{inst['launch_time']}[/dim]"
+                f"\n[yellow]⚠️  Failed to scan {len(region_errors)} regions[/yellow]"
             )
-            if tags_str:
-                console.print(f"    [dim]Tags: {tags_str}[/dim]")
 
-    # Phase 2: Terminate all instances
-    console.print(
-        f"\n[bold red]🔥 Terminating {len(all_instances)} instances across all regions![/bold red]"
-    )
+        if not all_instances:
+            rich_success("No spot instances found in any region!")
+            return
 
-    # Group instances by region for termination
-    termination_groups: dict[str, list[str]] = {}
-    for inst in all_instances:
-        region = inst["region"]
-        if region not in termination_groups:
-            termination_groups[region] = []
-        termination_groups[region].append(inst["id"])
+        # Display found instances, rendered in a single console write
+        lines = [f"\n[bold]Found {len(all_instances)} spot instances:[/bold]"]
+        for region, instances in sorted(found_by_region.items()):
+            lines.extend(("", f"[bold]{region}:[/bold]"))
+            lines.extend(_region_instance_lines(instances))
+        console.print("\n".join(lines))
 
-    console.print(
-        f"[dim]Terminating instances in {len(termination_groups)} regions...[/dim]\n"
-    )
-
-    terminated_count = 0
-    failed_count = 0
-    completed_terminations = 0
-
-    with ThreadPoolExecutor(max_workers=10) as executor:
-        # Submit termination requests
-        terminate_future_to_region: dict[Future[dict[str, str]], str] = {
-            executor.submit(terminate_instances_in_region, region, instance_ids): region
-            for region, instance_ids in termination_groups.items()
-        }
+        # Phase 2: Collect termination results
+        console.print(
+            f"\n[bold red]🔥 Terminating {len(all_instances)} instances across all regions![/bold red]"
+        )
+        console.print(
+            f"[dim]Terminating instances in {len(termination_groups)} regions...[/dim]\n"
+        )
 
-        # Process results
         for terminate_future in as_completed(terminate_future_to_region):
             region = terminate_future_to_region[terminate_future]
             completed_terminations += 1
@@ -243,10 +298,15 @@ def cmd_nuke(state: SimpleStateManager, config: SimpleConfig) -> None:
 
             try:
                 results = terminate_future.result()
-                success = sum(1 for status in results.values() if "ERROR" not in status)
+                succeeded = {
+                    inst_id
+                    for inst_id, status in results.items()
+                    if "ERROR" not in status
+                }
+                success = len(succeeded)
                 failed = len(results) - success
 
-                terminated_count += success
+                terminated_ids.update(succeeded)
                 failed_count += failed
 
                 if failed > 0:
@@ -268,18 +328,16 @@ def cmd_nuke(state: SimpleStateManager, config: SimpleConfig) -> None:
     # Summary
     console.print("\n" + "=" * 60)
     console.print("\n[bold]NUKE COMPLETE:[/bold]")
-    console.print(f"  [green]✅ Terminated: {terminated_count} instances[/green]")
+    console.print(f"  [green]✅ Terminated: {len(terminated_ids)} instances[/green]")
     if failed_count > 0:
         console.print(f"  [red]❌ Failed: {failed_count} instances[/red]")
 
     # Update local state to remove any terminated instances
-    if terminated_count > 0:
+    if terminated_ids:
         console.print("\n[dim]Updating local state...[/dim]")
-        current_instances = state.load_instances()
-        # Get all terminated instance IDs
-        terminated_ids = {inst["id"] for inst in all_instances}
+        # Only drop instances whose termination actually succeeded
         remaining_instances = [
-            inst for inst in current_instances if inst["id"] not in terminated_ids
+            inst for inst in local_instances if inst["id"] not in terminated_ids
         ]
         state.save_instances(remaining_instances)
         console.print("[dim]Local state updated.[/dim]")
@@ -288,7 +346,7 @@ def cmd_nuke(state: SimpleStateManager, config: SimpleConfig) -> None:
     console.print("\n[cyan]Phase 3: Cleaning up amauo VPCs...[/cyan]")
     vpc_cleanup_count = 0
 
-    for region in AWS_REGIONS:
+    for region in regions:
         try:
             from ..utils.aws_manager import AWSResourceManager
 
@@ -1,11 +1,23 @@
 """Random IP command - returns a random instance IP for SSH access."""
 
 import random
+import socket
 import sys
 
 from ..core.state import SimpleStateManager
 
 
+def _is_ipv4(value: str) -> bool:
+    """Return True if value is a dotted-quad IPv4 address."""
+    if value.count(".") != 3:
+        return False
+    try:
+        socket.inet_aton(value)
+    except OSError:
+        return False
+    return True
+
+
 def cmd_random_ip(state: SimpleStateManager) -> None:
     """Output a random IP address from running instances."""
 
@@ -17,9 +29,7 @@ def cmd_random_ip(state: SimpleStateManager) -> None:
         sys.exit(1)
 
     # Filter instances with valid IPs
-    instances_with_ip = [
-        i for i in instances if i.get("public_ip") and i.get("public_ip") != "pending"
-    ]
+    instances_with_ip = [i for i in instances if _is_ipv4(i.get("public_ip") or "")]
 
     if not instances_with_ip:
         print("", file=sys.stderr)  # Empty output
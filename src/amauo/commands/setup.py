@@ -6,7 +6,7 @@ from pathlib import Path
 import yaml
 from rich.panel import Panel
 
-from ..core.config import SimpleConfig
+from ..core.config import SimpleConfig, YAMLSafeLoader
 from ..utils.config_validator import ConfigValidator
 from ..utils.display import console, rich_error, rich_success, rich_warning
 
@@ -116,7 +116,7 @@ def cmd_setup(config: SimpleConfig) -> None:
     if os.path.exists(config.config_file):
         try:
             with open(config.config_file) as f:
-                existing_config = yaml.safe_load(f) or {}
+                existing_config = yaml.load(f, Loader=YAMLSafeLoader) or {}
 
             # Merge configs, preserving user values
             merged_config = merge_configs(existing_config, default_config)
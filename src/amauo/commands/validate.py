@@ -1,8 +1,12 @@
 """Validate command - validates deployment configuration before deployment."""
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
+from typing import Any, Callable, Optional
 
 from ..core.config import SimpleConfig
+from ..core.deployment import DeploymentConfig
 from ..core.deployment_discovery import DeploymentDiscovery, DeploymentMode
 from ..core.state import SimpleStateManager
 from ..utils.config_validator import ConfigValidator
@@ -10,6 +14,64 @@ from ..utils.display import console, rich_error, rich_print, rich_success, rich_
 from ..utils.file_uploader import FileUploader
 
 
+def _find_missing_files(deployment_config: DeploymentConfig) -> list[str]:
+    """List scripts, services and upload sources that do not exist.
+
+    The deployment directory is walked once and references are checked
+    against that listing instead of stat-ing each path separately.
+    """
+    spot_dir = deployment_config.spot_dir
+    refs: list[tuple[str, str]] = [
+        ("Script", script.get("path", "")) for script in deployment_config.scripts
+    ]
+    refs.extend(
+        ("Service", service["file"])
+        for service in deployment_config.services
+        if service.get("file")
+    )
+    refs.extend(
+        ("Upload", upload["source"])
+        for upload in deployment_config.uploads
+        if upload.get("source")
+    )
+
+    present: set[str] = set()
+    for root, dirs, files in os.walk(spot_dir):
+        rel_root = os.path.relpath(root, spot_dir)
+        for name in dirs + files:
+            present.add(os.path.normpath(os.path.join(rel_root, name)))
+
+    missing_files = []
+    for kind, rel_path in refs:
+        ref_path = os.path.normpath(rel_path)
+        if ref_path == "." or ref_path.startswith("..") or os.path.isabs(ref_path):
+            # Outside the walked tree, fall back to a direct check
+            exists = (spot_dir / rel_path).exists()
+        else:
+            exists = ref_path in present
+        if not exists:
+            missing_files.append(f"{kind}: {spot_dir / rel_path}")
+
+    return missing_files
+
+
+def _check_tarball_source(source_path: Path) -> Optional[str]:
+    """Check the tarball source directory, returning an error message if invalid."""
+    if not source_path.exists():
+        return f"Tarball source not found: {source_path}"
+    if not source_path.is_dir():
+        return f"Tarball source must be a directory: {source_path}"
+    return None
+
+
+def _check_uploads(deployment_config: DeploymentConfig) -> tuple[bool, list[str], int]:
+    """Validate upload sources and estimate their total size in bytes."""
+    uploader = FileUploader(deployment_config, deployment_config.spot_dir)
+    is_valid, upload_errors = uploader.validate_uploads()
+    total_size = uploader.estimate_upload_size() if is_valid else 0
+    return is_valid, upload_errors, total_size
+
+
 def cmd_validate(config: SimpleConfig, state: SimpleStateManager) -> None:
     """Validate deployment configuration and structure."""
     console.print("[bold]🔍 Validating Deployment Configuration[/bold]\n")
@@ -47,11 +109,32 @@ def cmd_validate(config: SimpleConfig, state: SimpleStateManager) -> None:
         rich_error("❌ Failed to load deployment configuration")
         return
 
+    # Steps 2-6 are independent file and parse checks, so run them together
+    # and report the results in a fixed order afterwards
+    validator = ConfigValidator()
+    checks: dict[str, Callable[[], Any]] = {
+        "aws_config": lambda: validator.validate_config_file(config.config_file),
+        "manifest": deployment_config.validate,
+        "missing_files": lambda: _find_missing_files(deployment_config),
+    }
+    if (
+        hasattr(deployment_config, "tarball_source")
+        and deployment_config.tarball_source
+    ):
+        tarball_source = deployment_config.tarball_source
+        checks["tarball"] = lambda: _check_tarball_source(Path(tarball_source))
+    if deployment_config.uploads:
+        checks["uploads"] = lambda: _check_uploads(deployment_config)
+
+    results: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        future_to_check = {executor.submit(fn): name for name, fn in checks.items()}
+        for future in as_completed(future_to_check):
+            results[future_to_check[future]] = future.result()
+
     # 2. Validate AWS configuration
     console.print("\nValidating AWS configuration...")
-    validator = ConfigValidator()
-    config_path = config.config_file
-    is_valid, config_errors = validator.validate_config_file(config_path)
+    is_valid, config_errors = results["aws_config"]
 
     if is_valid:
         rich_success("✅ AWS configuration is valid")
@@ -62,7 +145,7 @@ def cmd_validate(config: SimpleConfig, state: SimpleStateManager) -> None:
 
     # 3. Validate deployment configuration
     console.print("\nValidating deployment manifest...")
-    is_valid, deployment_errors = deployment_config.validate()
+    is_valid, deployment_errors = results["manifest"]
 
     if is_valid:
         rich_success("✅ Deployment manifest is valid")
@@ -73,29 +156,7 @@ def cmd_validate(config: SimpleConfig, state: SimpleStateManager) -> None:
 
     # 4. Check referenced files exist
     console.print("\nChecking referenced files...")
-    missing_files = []
-
-    # Check scripts
-    for script in deployment_config.scripts:
-        script_path = deployment_config.spot_dir / script.get("path", "")
-        if script_path and not script_path.exists():
-            missing_files.append(f"Script: {script_path}")
-
-    # Check services
-    for service in deployment_config.services:
-        service_file = service.get("file", "")
-        if service_file:
-            service_path = deployment_config.spot_dir / service_file
-            if not service_path.exists():
-                missing_files.append(f"Service: {service_path}")
-
-    # Check uploads
-    for upload in deployment_config.uploads:
-        source = upload.get("source", "")
-        if source:
-            source_path = deployment_config.spot_dir / source
-            if not source_path.exists():
-                missing_files.append(f"Upload: {source_path}")
+    missing_files = results["missing_files"]
 
     if missing_files:
         errors.extend(missing_files)
@@ -106,31 +167,24 @@ def cmd_validate(config: SimpleConfig, state: SimpleStateManager) -> None:
         rich_success("✅ All referenced files exist")
 
     # 5. Validate tarball source if specified
-    if (
-        hasattr(deployment_config, "tarball_source")
-        and deployment_config.tarball_source
-    ):
+    if "tarball" in results:
         console.print("\nValidating tarball source...")
-        source_path = Path(deployment_config.tarball_source)
-
-        if not source_path.exists():
-            errors.append(f"Tarball source not found: {source_path}")
-            rich_error(f"❌ Tarball source not found: {source_path}")
-        elif not source_path.is_dir():
-            errors.append(f"Tarball source must be a directory: {source_path}")
-            rich_error(f"❌ Tarball source must be a directory: {source_path}")
+        tarball_error = results["tarball"]
+
+        if tarball_error:
+            errors.append(tarball_error)
+            rich_error(f"❌ {tarball_error}")
         else:
-            rich_success(f"✅ Tarball source is valid: {source_path}")
+            rich_success(
+                f"✅ Tarball source is valid: {deployment_config.tarball_source}"
+            )
 
     # 6. Check file upload configuration
-    if deployment_config.uploads:
+    if "uploads" in results:
         console.print("\nValidating file uploads...")
-        uploader = FileUploader(deployment_config, deployment_config.spot_dir)
-        is_valid, upload_errors = uploader.validate_uploads()
+        is_valid, upload_errors, total_size = results["uploads"]
 
         if is_valid:
-            # Estimate upload size
-            total_size = uploader.estimate_upload_size()
             size_mb = total_size / (1024 * 1024)
             rich_success(f"✅ File uploads valid ({size_mb:.1f} MB)")
         else:
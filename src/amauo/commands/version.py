@@ -32,25 +32,26 @@ def get_git_info() -> dict[str, Any]:
     git_info: dict[str, Any] = {}
 
     try:
-        # Get current branch
+        # Branch, commit and working-tree state all come from one git status
         result = subprocess.run(
-            ["git", "rev-parse", "--abbrev-ref", "HEAD"],
+            ["git", "status", "--porcelain=v2", "--branch"],
             capture_output=True,
             text=True,
             check=False,
         )
         if result.returncode == 0:
-            git_info["branch"] = result.stdout.strip()
-
-        # Get full commit hash
-        result = subprocess.run(
-            ["git", "rev-parse", "HEAD"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode == 0:
-            git_info["commit"] = result.stdout.strip()
+            dirty = False
+            for line in result.stdout.splitlines():
+                if line.startswith("# branch.head "):
+                    head = line[len("# branch.head ") :]
+                    git_info["branch"] = "HEAD" if head == "(detached)" else head
+                elif line.startswith("# branch.oid "):
+                    oid = line[len("# branch.oid ") :]
+                    if oid != "(initial)":
+                        git_info["commit"] = oid
+                elif not line.startswith("#"):
+                    dirty = True
+            git_info["dirty"] = dirty
 
         # Get commit date
         result = subprocess.run(
@@ -62,16 +63,6 @@ def get_git_info() -> dict[str, Any]:
         if result.returncode == 0:
             git_info["commit_date"] = result.stdout.strip()
 
-        # Check if working directory is clean
-        result = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        if result.returncode == 0:
-            git_info["dirty"] = len(result.stdout.strip()) > 0
-
     except Exception:
         pass
 
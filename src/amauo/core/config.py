@@ -1,13 +1,50 @@
 """Configuration management for spot deployer."""
 
+import copy
+import functools
 import logging
 import os
-from typing import Any, Optional, cast
+from pathlib import Path
+from typing import Any, Optional, Union, cast
 
 import yaml
 
+try:
+    # libyaml's C parser, much faster than the pure-Python loader
+    from yaml import CSafeLoader as YAMLSafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YAMLSafeLoader  # type: ignore[assignment]
+
 logger = logging.getLogger(__name__)
 
+# Parsed YAML keyed by (resolved path, mtime_ns, size)
+_YAML_CACHE: dict[tuple[str, int, int], Any] = {}
+
+
+def load_yaml_file(path: Union[str, Path]) -> Any:
+    """Parse a YAML file, reusing the previous parse while it is unchanged.
+
+    The same files (config.yaml, deployment.yaml) are read by the CLI, the
+    validators and the deployment loader within one run. Callers get their
+    own copy of the cached data, so mutating it is safe.
+
+    Raises:
+        OSError: If the file cannot be read
+        yaml.YAMLError: If the file is not valid YAML
+    """
+    st = os.stat(path)
+    key = (os.path.realpath(path), st.st_mtime_ns, st.st_size)
+    if key not in _YAML_CACHE:
+        with open(path) as f:
+            _YAML_CACHE[key] = yaml.load(f, Loader=YAMLSafeLoader)
+    return copy.deepcopy(_YAML_CACHE[key])
+
+
+@functools.lru_cache(maxsize=32)
+def _expand_user(path: str) -> str:
+    """Expand ``~`` in a path, resolving the home directory once per path."""
+    return os.path.expanduser(path)
+
 
 class SimpleConfig:
     """Enhanced configuration loader with full options support."""
@@ -29,8 +66,7 @@ class SimpleConfig:
     def _load_config(self) -> dict:
         """Load YAML configuration."""
         try:
-            with open(self.config_file) as f:
-                return yaml.safe_load(f) or {}
+            return load_yaml_file(self.config_file) or {}
         except FileNotFoundError:
             logger.error(
                 f"Config file {self.config_file} not found. Run 'setup' first."
@@ -76,7 +112,7 @@ class SimpleConfig:
 
     def _resolve_ssh_path(self, path: str) -> str:
         """Resolve SSH path - just expand user paths."""
-        return os.path.expanduser(path)
+        return _expand_user(path)
 
     def public_ssh_key_content(self) -> Optional[str]:
         """Get public SSH key content."""
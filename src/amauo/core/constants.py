@@ -35,11 +35,21 @@ DEFAULT_CACHE_AGE_HOURS = 24
 DEFAULT_INSTANCE_TYPE = "t3.medium"
 DEFAULT_STORAGE_GB = 50
 
+# AWS client tuning
+# Sized above the widest ThreadPoolExecutor fan-out so worker threads reuse
+# pooled HTTPS connections instead of opening fresh ones per request
+DEFAULT_MAX_POOL_CONNECTIONS = 32
+# Upper bound for per-region thread fan-out; kept within the connection pool
+MAX_REGION_WORKERS = DEFAULT_MAX_POOL_CONNECTIONS
+
 # AWS constants
 CANONICAL_OWNER_ID = "099720109477"  # Ubuntu AMI owner
 DEFAULT_UBUNTU_AMI_PATTERN = (
     "ubuntu/images/hvm-ssd-gp3/ubuntu-noble-24.04-amd64-server-*"
 )
+LIVE_INSTANCE_STATES = ["pending", "running", "stopping", "stopped"]
+MAX_STATUS_INSTANCE_IDS = 100  # EC2 limit on IDs per DescribeInstanceStatus call
+MAX_TERMINATE_INSTANCE_IDS = 1000  # EC2 limit on IDs per TerminateInstances call
 
 # File paths - all relative to current working directory
 DEFAULT_CONFIG_FILE = "config.yaml"
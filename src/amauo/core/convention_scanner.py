@@ -1,6 +1,7 @@
 """Convention scanner for auto-detecting deployment structure from deployment/ directory."""
 
 import logging
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -8,6 +9,9 @@ from .deployment import DeploymentConfig
 
 logger = logging.getLogger(__name__)
 
+# A non-blank, non-comment line of packages.txt, captured without its padding
+_PACKAGE_LINE_RE = re.compile(r"^[ \t]*([^#\s][^\r\n]*?)[ \t\r]*$", re.MULTILINE)
+
 
 class ConventionScanner:
     """Scans deployment/ directory and builds DeploymentConfig from conventions."""
@@ -142,11 +146,7 @@ class ConventionScanner:
         # Check for packages.txt (explicit package list)
         packages_txt = self.deployment_dir / "packages.txt"
         if packages_txt.exists():
-            with open(packages_txt) as f:
-                for line in f:
-                    line = line.strip()
-                    if line and not line.startswith("#"):
-                        packages.append(line)
+            packages.extend(_PACKAGE_LINE_RE.findall(packages_txt.read_text()))
             logger.debug(f"Found packages.txt with {len(packages)} packages")
 
         # Remove duplicates while preserving order
@@ -6,6 +6,8 @@ from typing import Any, Optional
 
 import yaml
 
+from .config import YAMLSafeLoader, load_yaml_file
+
 
 @dataclass
 class DeploymentConfig:
@@ -60,8 +62,7 @@ class DeploymentConfig:
                 f"Deployment manifest not found: {config.deployment_path}"
             )
 
-        with open(config.deployment_path) as f:
-            manifest = yaml.safe_load(f)
+        manifest = load_yaml_file(config.deployment_path)
 
         # Parse manifest
         if manifest is None:
@@ -126,8 +127,7 @@ class DeploymentConfig:
         # Validate config.yaml structure
         if self.config_path.exists():
             try:
-                with open(self.config_path) as f:
-                    config = yaml.safe_load(f)
+                config = load_yaml_file(self.config_path)
 
                 # Check required fields
                 if not config.get("aws"):
@@ -238,7 +238,7 @@ class DeploymentValidator:
         """
         try:
             with open(file_path) as f:
-                yaml.safe_load(f)
+                yaml.load(f, Loader=YAMLSafeLoader)
             return True, None
         except yaml.YAMLError as e:
             return False, str(e)
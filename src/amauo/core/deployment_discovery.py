@@ -12,6 +12,31 @@ from .deployment import DeploymentConfig
 
 logger = logging.getLogger(__name__)
 
+# Entries that mark a directory as the project root (all lowercase)
+_ROOT_MARKERS = frozenset({".spot", "deployment", "config.yaml"})
+
+
+def _has_root_marker(directory: Path) -> bool:
+    """Check a directory for root markers with a single directory listing.
+
+    Exact, non-symlink matches are accepted straight from the listing. Case
+    variants and symlinks are confirmed with Path.exists(), so case-insensitive
+    filesystems still match and broken symlinks don't.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name.casefold()
+                if name not in _ROOT_MARKERS:
+                    continue
+                if entry.name == name and not entry.is_symlink():
+                    return True
+                if (directory / name).exists():
+                    return True
+    except OSError:
+        pass
+    return False
+
 
 class DeploymentMode(Enum):
     """Deployment mode enumeration."""
@@ -123,16 +148,8 @@ class DeploymentDiscovery:
         current = self.start_path.resolve()
 
         for _ in range(max_depth):
-            # Check for .spot directory
-            if (current / ".spot").exists():
-                return current
-
-            # Check for deployment directory
-            if (current / "deployment").exists():
-                return current
-
-            # Check for config.yaml (common root marker)
-            if (current / "config.yaml").exists():
+            # .spot, deployment/ or config.yaml (common root marker)
+            if _has_root_marker(current):
                 return current
 
             # Move up one directory
@@ -36,15 +36,20 @@ class SimpleStateManager:
                 os.makedirs(state_dir, exist_ok=True)
 
             data = {"instances": instances, "last_updated": datetime.now().isoformat()}
+            # Serialize first and write once; json.dump issues a write per token
             with open(self.state_file, "w") as f:
-                json.dump(data, f, indent=2, default=str)
+                f.write(json.dumps(data, indent=2, default=str))
         except Exception as e:
             logger.error(f"Error saving state: {e}")
 
     def add_instance(self, instance: dict) -> None:
         """Add instance to state."""
+        self.add_instances([instance])
+
+    def add_instances(self, new_instances: list[dict]) -> None:
+        """Add several instances to state with one read and one write."""
         instances = self.load_instances()
-        instances.append(instance)
+        instances.extend(new_instances)
         self.save_instances(instances)
 
     def remove_instances_by_region(self, region: str) -> int:
@@ -1,5 +1,6 @@
 """Cloud-init template system for customizable deployments."""
 
+import functools
 import logging
 import re
 from pathlib import Path
@@ -7,10 +8,24 @@ from typing import Any, Optional
 
 import yaml
 
+from ..core.config import YAMLSafeLoader
 from ..core.deployment import DeploymentConfig
 
 logger = logging.getLogger(__name__)
 
+# Matches both {{VAR}} and ${VAR} placeholders; shared by render and validate
+# so any name validation accepts is also substituted
+_PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}|\$\{([^{}]+)\}")
+# Placeholders filled in by the library templates themselves
+_BUILTIN_VARIABLES = frozenset({"PACKAGES", "SCRIPTS", "SERVICES", "UPLOAD_DIRS"})
+
+
+@functools.cache
+def _read_template_file(path: Path, mtime_ns: int) -> str:
+    """Read a template file, cached until its modification time changes."""
+    with open(path) as f:
+        return f.read()
+
 
 class CloudInitTemplate:
     """Manages cloud-init templates with variable substitution."""
@@ -33,8 +48,9 @@ class CloudInitTemplate:
         if not self.template_path or not self.template_path.exists():
             raise FileNotFoundError(f"Template file not found: {self.template_path}")
 
-        with open(self.template_path) as f:
-            self.template_content = f.read()
+        self.template_content = _read_template_file(
+            self.template_path, self.template_path.stat().st_mtime_ns
+        )
 
         logger.debug(f"Loaded template from {self.template_path}")
 
@@ -78,14 +94,18 @@ class CloudInitTemplate:
         rendered = self.template_content
         assert rendered is not None  # Should be guaranteed by logic above
         if rendered:
-            for key, value in template_vars.items():
-                # Support both {{VAR}} and ${VAR} syntax
-                rendered = rendered.replace(f"{{{{{key}}}}}", str(value))
-                rendered = rendered.replace(f"${{{key}}}", str(value))
+            # Substitute both {{VAR}} and ${VAR} syntax in a single pass
+            def substitute(match: re.Match[str]) -> str:
+                key = match.group(1) or match.group(2)
+                if key in template_vars:
+                    return str(template_vars[key])
+                return match.group(0)
+
+            rendered = _PLACEHOLDER_RE.sub(substitute, rendered)
 
             # Validate the rendered YAML
             try:
-                yaml.safe_load(rendered)
+                yaml.load(rendered, Loader=YAMLSafeLoader)
             except yaml.YAMLError as e:
                 logger.warning(f"Rendered template is not valid YAML: {e}")
         else:
@@ -232,24 +252,18 @@ runcmd:
 
         if self.template_content:
             # Check for unsubstituted variables
-            unsubstituted = re.findall(
-                r"\{\{([^}]+)\}\}|\$\{([^}]+)\}", self.template_content
-            )
-            if unsubstituted:
-                unique_vars = {var[0] or var[1] for var in unsubstituted}
-                # Check if these will be substituted
-                for var in unique_vars:
-                    if var not in self.variables and var not in [
-                        "PACKAGES",
-                        "SCRIPTS",
-                        "SERVICES",
-                        "UPLOAD_DIRS",
-                    ]:
-                        errors.append(f"Template variable not defined: {var}")
+            unique_vars = {
+                match.group(1) or match.group(2)
+                for match in _PLACEHOLDER_RE.finditer(self.template_content)
+            }
+            # Check if these will be substituted
+            for var in unique_vars:
+                if var not in self.variables and var not in _BUILTIN_VARIABLES:
+                    errors.append(f"Template variable not defined: {var}")
 
             # Try to parse as YAML
             try:
-                yaml.safe_load(self.template_content)
+                yaml.load(self.template_content, Loader=YAMLSafeLoader)
             except yaml.YAMLError as e:
                 errors.append(f"Template is not valid YAML: {e}")
 
@@ -370,7 +384,7 @@ class TemplateInjector:
         """
         # Parse the base template
         try:
-            cloud_init = yaml.safe_load(self.base_template)
+            cloud_init = yaml.load(self.base_template, Loader=YAMLSafeLoader)
             # Check if it's a valid dict (cloud-init should be)
             if not isinstance(cloud_init, dict):
                 logger.warning(
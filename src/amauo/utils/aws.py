@@ -8,8 +8,6 @@ import time
 from datetime import datetime
 from typing import Any, Optional, cast
 
-import boto3
-
 from ..core.constants import (
     CACHE_DIR,
     CANONICAL_OWNER_ID,
@@ -24,6 +22,14 @@ logger = logging.getLogger(__name__)
 AMI_CACHE: dict[str, str] = {}
 CACHE_LOCK = threading.Lock()
 
+# Successful auth checks per AWS profile: (expiry timestamp, auth message)
+AUTH_CACHE: dict[str, tuple[float, str]] = {}
+AUTH_CACHE_TTL_SECONDS = 300
+
+# STS caller identity per AWS profile: (expiry timestamp, identity)
+IDENTITY_CACHE: dict[str, tuple[float, dict[str, Any]]] = {}
+IDENTITY_LOCK = threading.Lock()
+
 
 def cache_file_fresh(
     filepath: str, max_age_hours: int = DEFAULT_CACHE_AGE_HOURS
@@ -51,19 +57,25 @@ def save_cache(filepath: str, data: dict) -> None:
     try:
         os.makedirs(os.path.dirname(filepath), exist_ok=True)
         with open(filepath, "w") as f:
-            json.dump(data, f, indent=2, default=str)
+            f.write(json.dumps(data, indent=2, default=str))
     except Exception:
         pass
 
 
+def default_cache_dir() -> str:
+    """Get the AWS lookup cache directory, honouring SPOT_OUTPUT_DIR."""
+    cache_dir = os.environ.get("SPOT_OUTPUT_DIR", CACHE_DIR)
+    if cache_dir != CACHE_DIR:
+        cache_dir = os.path.join(cache_dir, ".aws_cache")
+    return cache_dir
+
+
 def get_latest_ubuntu_ami(
     region: str, log_function: Optional[Any] = None, cache_dir: Optional[str] = None
 ) -> Optional[str]:
     """Get latest Ubuntu 24.04 LTS AMI for region."""
     if cache_dir is None:
-        cache_dir = os.environ.get("SPOT_OUTPUT_DIR", CACHE_DIR)
-        if cache_dir != CACHE_DIR:
-            cache_dir = os.path.join(cache_dir, ".aws_cache")
+        cache_dir = default_cache_dir()
     cache_file = f"{cache_dir}/ami_{region}.json"
 
     def log_message(msg: str) -> None:
@@ -90,7 +102,9 @@ def get_latest_ubuntu_ami(
     # Fetch from AWS
     try:
         log_message(f"Fetching AMI for {region}...")
-        ec2 = boto3.client("ec2", region_name=region)
+        from .aws_manager import get_ec2_client
+
+        ec2 = get_ec2_client(region)
         response = ec2.describe_images(
             Owners=[CANONICAL_OWNER_ID],  # Canonical
             Filters=[
@@ -107,11 +121,9 @@ def get_latest_ubuntu_ami(
         )
 
         if response["Images"]:
-            # Sort by creation date to get latest
-            images = sorted(
-                response["Images"], key=lambda x: x["CreationDate"], reverse=True
-            )
-            ami_id = images[0]["ImageId"]
+            # Latest by creation date; a linear scan, no need to sort them all
+            latest = max(response["Images"], key=lambda x: x["CreationDate"])
+            ami_id = latest["ImageId"]
             log_message(f"Found AMI for {region}: {ami_id}")
             # Cache result
             save_cache(
@@ -129,29 +141,72 @@ def get_latest_ubuntu_ami(
     return None
 
 
+def get_caller_identity() -> dict[str, Any]:
+    """Return the STS caller identity for the current AWS profile.
+
+    The auth check and the CreatedBy tag both need it, so it is fetched once
+    and shared for AUTH_CACHE_TTL_SECONDS. Concurrent callers wait for the
+    lookup in flight rather than issuing their own; failures aren't cached.
+    """
+    profile = os.environ.get("AWS_PROFILE", "default")
+    with IDENTITY_LOCK:
+        cached = IDENTITY_CACHE.get(profile)
+        if cached and cached[0] > time.time():
+            return cached[1]
+
+        import boto3
+
+        # Own session: the default boto3 session isn't safe to share across threads
+        sts = boto3.session.Session().client("sts")
+        identity = cast(dict[str, Any], sts.get_caller_identity())
+        IDENTITY_CACHE[profile] = (time.time() + AUTH_CACHE_TTL_SECONDS, identity)
+        return identity
+
+
 def check_aws_auth() -> bool:
-    """Check AWS authentication and display which credentials are being used."""
+    """Check AWS authentication and display which credentials are being used.
+
+    A successful check is remembered per AWS profile for a few minutes so
+    repeated commands in one process skip the STS round trip.
+    """
+    from .display import console
+
+    profile = os.environ.get("AWS_PROFILE", "default")
+    with CACHE_LOCK:
+        cached = AUTH_CACHE.get(profile)
+    if cached and cached[0] > time.time():
+        if console:
+            console.print(cached[1], style="green")
+        else:
+            logger.info(cached[1])
+        return True
+
     try:
-        sts = boto3.client("sts")
-        caller_identity = sts.get_caller_identity()
+        caller_identity = get_caller_identity()
 
         # Get the ARN and extract useful information
         arn = caller_identity.get("Arn", "")
         account = caller_identity.get("Account", "unknown")
 
+        # Tokenize the ARN once: arn:partition:service:region:account:resource
+        fields = arn.split(":", 5)
+        service, resource = (fields[2], fields[5]) if len(fields) == 6 else ("", "")
+        resource_type, _, resource_path = resource.partition("/")
+        path_parts = resource_path.split("/")
+
         # Determine the type of credentials being used
-        if "assumed-role" in arn:
-            # SSO or assumed role
-            role_name = arn.split("/")[-2] if "/" in arn else "unknown"
-            user_name = arn.split("/")[-1] if "/" in arn else "unknown"
+        if resource_type == "assumed-role":
+            # SSO or assumed role: assumed-role/<role>/<session>
+            role_name = path_parts[0] if len(path_parts) > 1 else "unknown"
+            user_name = path_parts[-1] if len(path_parts) > 1 else "unknown"
             cred_type = "AWS SSO/AssumedRole"
             cred_info = f"{role_name} (user: {user_name})"
-        elif ":user/" in arn:
-            # IAM user
-            user_name = arn.split("/")[-1] if "/" in arn else "unknown"
+        elif resource_type == "user" and resource_path:
+            # IAM user, possibly under a path
+            user_name = path_parts[-1]
             cred_type = "IAM User"
             cred_info = user_name
-        elif "arn:aws:iam::" in arn and ":root" in arn:
+        elif service == "iam" and resource == "root":
             # Root account (not recommended)
             cred_type = "Root Account"
             cred_info = "⚠️  WARNING: Using root credentials"
@@ -161,19 +216,19 @@ def check_aws_auth() -> bool:
             cred_info = "from environment or config"
 
         # Display the authentication information
-        from .display import console
-
+        auth_message = f"✓ AWS Auth: {cred_type} - {cred_info} (Account: {account})"
         if console:
             # Just print simple message, don't build unused panel
-            console.print(
-                f"✓ AWS Auth: {cred_type} - {cred_info} (Account: {account})",
-                style="green",
-            )
+            console.print(auth_message, style="green")
         else:
-            logger.info(f"✓ AWS Auth: {cred_type} - {cred_info} (Account: {account})")
+            logger.info(auth_message)
 
+        with CACHE_LOCK:
+            AUTH_CACHE[profile] = (time.time() + AUTH_CACHE_TTL_SECONDS, auth_message)
         return True
     except Exception as e:
+        with CACHE_LOCK:
+            AUTH_CACHE.pop(profile, None)
         if "token has expired" in str(e).lower():
             rich_error("AWS credentials expired. Run: aws sso login")
         else:
@@ -1,9 +1,13 @@
 """AWS Resource Manager - Centralized AWS operations management."""
 
+import functools
+import hashlib
+import os
 import time
+from datetime import datetime
 
 # Type hint imports
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Optional, cast
 
 import boto3
 from botocore.config import Config as BotoConfig
@@ -19,7 +23,34 @@ else:
 
     EC2Client = Any
 
-from ..core.constants import CANONICAL_OWNER_ID, DEFAULT_UBUNTU_AMI_PATTERN
+from ..core.constants import (
+    CANONICAL_OWNER_ID,
+    DEFAULT_MAX_POOL_CONNECTIONS,
+    DEFAULT_UBUNTU_AMI_PATTERN,
+)
+from .aws import default_cache_dir, load_cache, save_cache
+
+# Shared client config for every EC2 client the tool creates
+EC2_CLIENT_CONFIG = BotoConfig(
+    retries={
+        "max_attempts": 3,  # Retry up to 3 times for transient errors
+        "mode": "adaptive",  # Use adaptive retry mode for better handling
+    },
+    connect_timeout=10,  # 10 second connection timeout
+    read_timeout=60,  # 60 second read timeout
+    max_pool_connections=DEFAULT_MAX_POOL_CONNECTIONS,  # Reuse connections across threads
+    tcp_keepalive=True,
+)
+
+
+@functools.cache
+def get_ec2_client(region: str) -> EC2Client:
+    """Get the shared EC2 client for a region, creating it on first use.
+
+    boto3 clients are thread-safe, so one client (and its connection pool)
+    is reused by every worker thread that talks to the same region.
+    """
+    return boto3.client("ec2", region_name=region, config=EC2_CLIENT_CONFIG)
 
 
 class AWSResourceManager:
@@ -32,17 +63,9 @@ class AWSResourceManager:
 
     @property
     def ec2(self) -> EC2Client:
-        """Lazy-load EC2 client with optimized config."""
+        """Lazy-load the shared EC2 client for this region."""
         if self._ec2 is None:
-            boto_config = BotoConfig(
-                retries={
-                    "max_attempts": 3,  # Retry up to 3 times for transient errors
-                    "mode": "adaptive",  # Use adaptive retry mode for better handling
-                },
-                connect_timeout=10,  # 10 second connection timeout
-                read_timeout=60,  # 60 second read timeout
-            )
-            self._ec2 = boto3.client("ec2", region_name=self.region, config=boto_config)
+            self._ec2 = get_ec2_client(self.region)
         return self._ec2
 
     def find_or_create_vpc(
@@ -228,7 +251,20 @@ class AWSResourceManager:
     def find_ubuntu_ami(
         self, ami_pattern: str = DEFAULT_UBUNTU_AMI_PATTERN
     ) -> Optional[str]:
-        """Find the latest Ubuntu AMI."""
+        """Find the latest Ubuntu AMI.
+
+        The answer changes rarely, so it is kept in the on-disk AWS cache
+        (per region and pattern) and the describe_images call is skipped
+        while that entry is fresh.
+        """
+        pattern_digest = hashlib.sha1(ami_pattern.encode()).hexdigest()[:12]
+        cache_file = os.path.join(
+            default_cache_dir(), f"ubuntu_ami_{self.region}_{pattern_digest}.json"
+        )
+        cached = load_cache(cache_file)
+        if cached and "ami_id" in cached:
+            return cast(str, cached["ami_id"])
+
         try:
             response = self.ec2.describe_images(
                 Owners=[CANONICAL_OWNER_ID],
@@ -243,12 +279,14 @@ class AWSResourceManager:
             if not response["Images"]:
                 return None
 
-            # Sort by creation date and get the latest
-            images = sorted(
-                response["Images"], key=lambda x: x["CreationDate"], reverse=True
-            )
+            # Only the latest image is needed, so a linear scan beats sorting
+            latest = max(response["Images"], key=lambda x: x["CreationDate"])
+            ami_id = latest["ImageId"]
 
-            return images[0]["ImageId"]
+            save_cache(
+                cache_file, {"ami_id": ami_id, "timestamp": datetime.now().isoformat()}
+            )
+            return ami_id
 
         except Exception as e:
             # Log error but don't fail - will try default AMI
@@ -363,24 +401,29 @@ class AWSResourceManager:
 
     def get_instance_state(self, instance_id: str) -> str:
         """Get the current state of an instance."""
+        return self.get_instance_state_and_vpc(instance_id)[0]
+
+    def get_instance_state_and_vpc(self, instance_id: str) -> tuple[str, Optional[str]]:
+        """Get the state and VPC ID of an instance from a single lookup."""
         try:
             response = self.ec2.describe_instances(InstanceIds=[instance_id])
 
             for reservation in response.get("Reservations", []):
                 for instance in reservation.get("Instances", []):
-                    return instance.get("State", {}).get("Name", "unknown")
+                    state = instance.get("State", {}).get("Name", "unknown")
+                    return state, instance.get("VpcId")
 
-            return "not-found"
+            return "not-found", None
         except ClientError as e:
             error_code = e.response.get("Error", {}).get("Code", "")
             if error_code == "InvalidInstanceID.NotFound":
-                return "not-found"
+                return "not-found", None
             elif error_code == "UnauthorizedOperation":
-                return "unauthorized"
+                return "unauthorized", None
             # For other errors, return error state
-            return "error"
+            return "error", None
         except Exception:
-            return "error"
+            return "error", None
 
     def terminate_instance(self, instance_id: str) -> bool:
         """Terminate a specific instance."""
@@ -4,6 +4,7 @@ import os
 
 import yaml
 
+from ..core.config import load_yaml_file
 from ..utils.ui_manager import UIManager
 
 
@@ -33,8 +34,7 @@ class ConfigValidator:
 
         # Load and parse YAML
         try:
-            with open(config_path) as f:
-                config = yaml.safe_load(f) or {}
+            config = load_yaml_file(config_path) or {}
         except yaml.YAMLError as e:
             self.errors.append(f"Invalid YAML syntax: {e}")
             return False, {}
@@ -277,10 +277,9 @@ class ConfigValidator:
 
         # Check AWS credentials
         try:
-            import boto3
+            from .aws import get_caller_identity
 
-            sts = boto3.client("sts")
-            sts.get_caller_identity()
+            get_caller_identity()
         except Exception:
             env_errors.append(
                 "AWS credentials not configured. Run 'aws configure' or set AWS_PROFILE"
@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Callable, Optional
 
 from ..core.deployment import DeploymentConfig
+from .ssh import ssh_control_args
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +30,8 @@ class FileUploader:
             "failed_files": 0,
             "total_bytes": 0,
         }
+        # Upload sizes keyed by (source path, exclude patterns)
+        self._size_cache: dict[tuple[str, tuple[str, ...]], int] = {}
 
     def upload_all(
         self,
@@ -184,6 +187,7 @@ class FileUploader:
             "UserKnownHostsFile=/dev/null",
             "-o",
             "LogLevel=ERROR",
+            *ssh_control_args(),
             "-i",
             key_path,
             f"{username}@{host}",
@@ -203,6 +207,7 @@ class FileUploader:
             "UserKnownHostsFile=/dev/null",
             "-o",
             "LogLevel=ERROR",
+            *ssh_control_args(),
             "-i",
             key_path,
             str(local_path),
@@ -229,6 +234,7 @@ class FileUploader:
             "UserKnownHostsFile=/dev/null",
             "-o",
             "LogLevel=ERROR",
+            *ssh_control_args(),
             "-i",
             key_path,
             f"{username}@{host}",
@@ -283,14 +289,70 @@ class FileUploader:
             Total size in bytes
         """
         total_size = 0
-        upload_list = self._prepare_upload_list()
 
-        for local_path, _, _ in upload_list:
-            if local_path.exists():
-                total_size += local_path.stat().st_size
+        for upload_spec in self.config.uploads:
+            source = upload_spec.get("source")
+            if not source:
+                continue
+
+            source_path = self.base_dir / source
+            exclude = upload_spec.get("exclude", [])
+            cache_key = (str(source_path), tuple(exclude))
+            if cache_key not in self._size_cache:
+                if source_path.is_file():
+                    size = source_path.stat().st_size
+                elif source_path.is_dir():
+                    size = self._tree_size(source_path, exclude)
+                else:
+                    size = 0
+                self._size_cache[cache_key] = size
+            total_size += self._size_cache[cache_key]
 
         return total_size
 
+    def _tree_size(self, root: Path, exclude_patterns: list[str]) -> int:
+        """Sum the sizes of all non-excluded files below a directory.
+
+        Uses os.scandir so file type and size come from the directory entry
+        rather than separate stat calls per path. Symlinked files count
+        at their target's size, symlinked directories are not followed, and
+        unreadable entries are skipped.
+
+        Args:
+            root: Directory to walk
+            exclude_patterns: List of exclusion patterns
+
+        Returns:
+            Total size in bytes
+        """
+        total = 0
+        stack = [str(root)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as entries:
+                    for entry in entries:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                stack.append(entry.path)
+                                continue
+                            if not entry.is_file():
+                                continue
+                            size = entry.stat().st_size
+                        except OSError as e:
+                            # e.g. a symlink pointing back at itself
+                            logger.debug(
+                                f"Skipping unreadable entry in size estimate: {e}"
+                            )
+                            continue
+                        if exclude_patterns and self._should_exclude(
+                            Path(entry.path), exclude_patterns
+                        ):
+                            continue
+                        total += size
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory in size estimate: {e}")
+        return total
+
     def validate_uploads(self) -> tuple[bool, list[str]]:
         """Validate that all source files exist.
 
@@ -1,22 +1,34 @@
 """Logging utilities for spot deployer."""
 
+import io
 import logging
+import os
 import re
+import threading
+import time
 from collections import deque
-from typing import Any, Optional
+from typing import Any, Optional, cast
 
 from .display import console
 
+# "[i-0123abcd @ 1.2.3.4] message" - instance ID and IP already present
+_INSTANCE_PREFIX_RE = re.compile(r"^\[([i-][a-z0-9]+)\s*@\s*([\d.]+)\]\s*(.*)")
+# First "[...]" in a message, e.g. an instance key
+_BRACKETED_KEY_RE = re.compile(r"\[([^\]]+)\]")
+
 
 class LogBuffer:
     """In-memory buffer for log messages (max 100 messages)."""
 
     def __init__(self, maxlen: int = 100) -> None:
         self.buffer: deque[str] = deque(maxlen=maxlen)
+        # Set on every append so displays can redraw only when needed
+        self.updated = threading.Event()
 
     def append(self, message: str) -> None:
         """Add a message to the buffer."""
         self.buffer.append(message)
+        self.updated.set()
 
     def get_lines(self) -> list[str]:
         """Get all buffered messages as a list."""
@@ -47,9 +59,7 @@ class ConsoleLogger(logging.Handler):
             msg = self.format(record)
 
             # Check if the message already contains instance ID and IP
-            instance_pattern = re.match(
-                r"^\[([i-][a-z0-9]+)\s*@\s*([\d.]+)\]\s*(.*)", msg
-            )
+            instance_pattern = msg.startswith("[") and _INSTANCE_PREFIX_RE.match(msg)
 
             if instance_pattern:
                 # Message already has instance ID and IP, use as-is
@@ -62,14 +72,14 @@ class ConsoleLogger(logging.Handler):
 
                 # Thread names are like "Setup-i-1234567890abcdef0" or "Region-us-west-2"
                 if thread_name.startswith("Setup-"):
-                    instance_key = thread_name.replace("Setup-", "")
+                    instance_key = thread_name[len("Setup-") :]
                     # Look up IP address from our map
                     instance_ip = self.instance_ip_map.get(instance_key, "")
-                elif "-" in thread_name and thread_name.split("-")[0] == "Region":
+                elif thread_name.startswith("Region-"):
                     # For region threads, try to extract from the message
                     if "[" in msg and "]" in msg:
                         # Message already has instance key
-                        match = re.search(r"\[([^\]]+)\]", msg)
+                        match = _BRACKETED_KEY_RE.search(msg)
                         if match:
                             potential_key = match.group(1)
                             if potential_key in self.instance_ip_map:
@@ -79,7 +89,7 @@ class ConsoleLogger(logging.Handler):
                                 )
                     else:
                         # Add region context
-                        region = thread_name.replace("Region-", "")
+                        region = thread_name[len("Region-") :]
                         msg = f"[{region}] {msg}"
 
                 # Build the prefix with instance key and IP
@@ -109,6 +119,97 @@ class ConsoleLogger(logging.Handler):
             self.handleError(record)
 
 
+class BufferedFileHandler(logging.FileHandler):
+    """File handler that flushes at most once per ``flush_interval`` seconds.
+
+    logging.FileHandler flushes after every record, which costs a write
+    syscall per log line while many setup threads are logging. Records are
+    instead collected in a larger file buffer and a timer flushes them within
+    ``flush_interval`` of being written, so the file never lags further than
+    that even when logging goes quiet. Errors are flushed right away and
+    everything is flushed on close.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        flush_interval: float = 1.0,
+        buffer_size: int = 65536,
+    ) -> None:
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self._last_flush = time.monotonic()
+        self._flush_timer: Optional[threading.Timer] = None
+        super().__init__(filename)
+
+    def _open(self) -> io.TextIOWrapper:
+        stream = open(
+            self.baseFilename,
+            self.mode,
+            buffering=self.buffer_size,
+            encoding=self.encoding,
+            errors=self.errors,
+        )
+        return cast(io.TextIOWrapper, stream)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        super().emit(record)
+        if record.levelno >= logging.ERROR:
+            self._flush_now()
+        elif self._flush_timer is None:
+            # Called with the handler lock held, so only one timer is armed
+            self._flush_timer = threading.Timer(self.flush_interval, self._timer_flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        if time.monotonic() - self._last_flush >= self.flush_interval:
+            self._flush_now()
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+        finally:
+            self.release()
+        super().close()
+
+    def _timer_flush(self) -> None:
+        self.acquire()
+        try:
+            self._flush_timer = None
+            self._flush_now()
+        finally:
+            self.release()
+
+    def _flush_now(self) -> None:
+        self._last_flush = time.monotonic()
+        super().flush()
+
+
+def read_log_tail(log_filename: str, max_lines: int = 10) -> list[str]:
+    """Return the last lines of a log file without reading all of it.
+
+    The live display polls the debug log several times a second, so the file
+    is read backwards in blocks until enough lines have been seen.
+    """
+    block_size = 8192
+    with open(log_filename, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b""
+        while pos > 0 and data.count(b"\n") <= max_lines:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            f.seek(pos)
+            data = f.read(read_size) + data
+
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return [line.rstrip() for line in lines[-max_lines:]]
+
+
 def setup_logger(
     name: str,
     log_filename: Optional[str] = None,
@@ -121,7 +222,7 @@ def setup_logger(
     if not logger.handlers:
         # File handler (only if filename provided)
         if log_filename:
-            file_handler = logging.FileHandler(log_filename)
+            file_handler = BufferedFileHandler(log_filename)
             file_handler.setLevel(logging.INFO)
             formatter = logging.Formatter("%(asctime)s - %(threadName)s - %(message)s")
             file_handler.setFormatter(formatter)
@@ -1,8 +1,11 @@
 """Portable cloud-init generator that creates cloud-init from DeploymentConfig."""
 
+import io
 import logging
+import os
+import textwrap
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
 from ..core.deployment import DeploymentConfig
 from ..templates.cloud_init_templates import CloudInitTemplate
@@ -11,104 +14,30 @@ from ..utils.service_installer import ServiceInstaller
 logger = logging.getLogger(__name__)
 
 
-class PortableCloudInitGenerator:
-    """Generates cloud-init configuration from DeploymentConfig."""
-
-    def __init__(
-        self, deployment_config: DeploymentConfig, ssh_public_key: Optional[str] = None
-    ):
-        """Initialize generator with deployment configuration.
-
-        Args:
-            deployment_config: DeploymentConfig object with deployment specs
-            ssh_public_key: Optional SSH public key to add to the ubuntu user
-        """
-        self.config = deployment_config
-        self.ssh_public_key = ssh_public_key
-
-    def generate(self) -> str:
-        """Generate complete cloud-init YAML configuration.
-
-        Returns:
-            String containing the cloud-init YAML
-        """
-        sections = []
-
-        # Start with cloud-init header
-        sections.append("#cloud-config")
-
-        # Add package installation
-        if self.config.packages:
-            sections.append(self._generate_packages_section())
-
-        # Add users section (for creating directories)
-        sections.append(self._generate_users_section())
-
-        # Add write_files section for inline files
-        write_files = self._generate_write_files_section()
-        if write_files:
-            sections.append(write_files)
-
-        # Add runcmd section for scripts and setup
-        runcmd = self._generate_runcmd_section()
-        if runcmd:
-            sections.append(runcmd)
-
-        # Join all sections with newlines
-        cloud_init = "\n\n".join(filter(None, sections))
-
-        logger.debug(f"Generated cloud-init with {len(sections)} sections")
-        return cloud_init
-
-    def _generate_packages_section(self) -> str:
-        """Generate packages section for cloud-init.
-
-        Returns:
-            YAML string for packages section
-        """
-        if not self.config.packages:
-            return ""
-
-        packages_yaml = "packages:\n"
-        for package in self.config.packages:
-            packages_yaml += f"  - {package}\n"
-
-        logger.debug(
-            f"Generated packages section with {len(self.config.packages)} packages"
-        )
-        return packages_yaml.rstrip()
+def _write_file_spec(buf: io.StringIO, file_spec: dict) -> None:
+    """Write one write_files entry, indenting its content as a literal block."""
+    buf.write(f"  - path: {file_spec['path']}\n")
+    buf.write(f"    permissions: '{file_spec['permissions']}'\n")
+    buf.write("    content: |\n")
+    content = file_spec["content"]
+    if content:
+        # Indent blank lines too, matching a per-line prefix
+        buf.write(textwrap.indent(content, "      ", lambda line: True))
+        if not content.endswith("\n"):
+            buf.write("\n")
 
-    def _generate_users_section(self) -> str:
-        """Generate users section to ensure ubuntu user exists.
 
-        Returns:
-            YAML string for users section
-        """
-        users_yaml = """users:
+_USERS_YAML = """users:
   - default
   - name: ubuntu
     groups: sudo, docker
     shell: /bin/bash
     sudo: ALL=(ALL) NOPASSWD:ALL"""
+# Users section with the ubuntu user's authorized key slot, filled per render
+_USERS_YAML_WITH_KEY = _USERS_YAML + "\n    ssh_authorized_keys:\n      - {key}"
 
-        # Add SSH key if provided
-        if self.ssh_public_key:
-            users_yaml += f"""
-    ssh_authorized_keys:
-      - {self.ssh_public_key}"""
-
-        return users_yaml
-
-    def _generate_write_files_section(self) -> str:
-        """Generate write_files section for inline configuration files.
-
-        Returns:
-            YAML string for write_files section
-        """
-        write_files = []
-
-        # Add a minimal deployment script that waits for uploads
-        deployment_script = """#!/bin/bash
+# Minimal deployment script that waits for uploads
+_DEPLOYMENT_SCRIPT = """#!/bin/bash
 set -e
 
 echo "Waiting for file uploads to complete..."
@@ -143,55 +72,35 @@ echo "Deployment completed"
 touch /opt/deployment.complete
 """
 
-        write_files.append(
-            {
-                "path": "/opt/deploy.sh",
-                "content": deployment_script,
-                "permissions": "0755",
-            }
-        )
-
-        # Only add small marker files, not service files (those get uploaded)
-        write_files.append(
-            {
-                "path": "/opt/deployment.marker",
-                "content": "Portable deployment\n",
-                "permissions": "0644",
-            }
-        )
-
-        if not write_files:
-            return ""
 
-        # Build YAML
-        yaml_lines = ["write_files:"]
-        for file_spec in write_files:
-            yaml_lines.append(f"  - path: {file_spec['path']}")
-            yaml_lines.append(f"    permissions: '{file_spec['permissions']}'")
-            yaml_lines.append("    content: |")
-            # Indent content properly
-            for line in file_spec["content"].splitlines():
-                yaml_lines.append(f"      {line}")
+# Only small marker files, not service files (those get uploaded)
+_WRITE_FILES = [
+    {
+        "path": "/opt/deploy.sh",
+        "content": _DEPLOYMENT_SCRIPT,
+        "permissions": "0755",
+    },
+    {
+        "path": "/opt/deployment.marker",
+        "content": "Portable deployment\n",
+        "permissions": "0644",
+    },
+]
 
-        return "\n".join(yaml_lines)
 
-    def _generate_runcmd_section(self) -> str:
-        """Generate runcmd section for script execution and tarball handling.
+def _build_write_files_section() -> str:
+    """Render the constant write_files section once at import time."""
+    buf = io.StringIO()
+    buf.write("write_files:\n")
+    for file_spec in _WRITE_FILES:
+        _write_file_spec(buf, file_spec)
+    return buf.getvalue().rstrip("\n")
 
-        Returns:
-            YAML string for runcmd section
-        """
-        commands = []
 
-        # Create necessary directories
-        commands.extend(
-            [
-                "mkdir -p /opt/deployment",
-            ]
-        )
+_WRITE_FILES_SECTION = _build_write_files_section()
 
-        # Add script to wait for upload completion marker
-        wait_script = """
+# Wait for the upload completion marker with a timeout
+_WAIT_SCRIPT = """
 # Wait for upload completion marker with timeout
 echo "Waiting for file upload to complete..."
 MAX_WAIT=180  # 3 minutes timeout (reduced from 5)
@@ -218,12 +127,9 @@ fi
 
 echo "Upload complete marker detected"
 """
-        commands.append(wait_script)
 
-        # Handle tarball deployment if specified
-        if hasattr(self.config, "tarball_source") and self.config.tarball_source:
-            # Add extraction commands for the tarball that will be uploaded
-            extract_script = """
+# Extract the deployment tarball (after upload is complete)
+_EXTRACT_SCRIPT = """
 # Extract deployment tarball (after upload is complete)
 if [ -f /tmp/deployment.tar.gz ]; then
     echo "Extracting deployment package..."
@@ -242,10 +148,9 @@ else
     echo "Warning: No deployment tarball found at /tmp/deployment.tar.gz"
 fi
 """
-            commands.append(extract_script)
 
-            # Add command to run setup script if it exists in the extracted tarball
-            setup_script = """
+# Run setup script from the extracted tarball if it exists
+_SETUP_SCRIPT = """
 # Run setup script from extracted tarball if it exists
 if [ -f /opt/deployment/setup.sh ]; then
     echo "Running setup.sh script..."
@@ -261,16 +166,8 @@ fi
 touch /opt/deployment.complete
 echo "Deployment process finished"
 """
-            commands.append(setup_script)
 
-        # Install services if defined
-        if self.config.services:
-            installer = ServiceInstaller(self.config)
-            service_commands = installer.generate_install_commands()
-
-            if service_commands:
-                # Create service installation script
-                service_script = """cat > /tmp/install_services.sh << 'EOF'
+_SERVICE_SCRIPT_HEADER = """cat > /tmp/install_services.sh << 'EOF'
 #!/bin/bash
 set -e
 # Wait for files to be uploaded
@@ -278,38 +175,185 @@ while [ ! -f /opt/uploads.complete ] && [ ! -f /opt/deployment.complete ]; do
     sleep 2
 done
 """
-                for cmd in service_commands:
-                    if not cmd.startswith("#"):
-                        service_script += f"{cmd}\n"
-                service_script += """EOF
+
+_SERVICE_SCRIPT_FOOTER = """EOF
 chmod +x /tmp/install_services.sh
 nohup bash -c 'sleep 45; /tmp/install_services.sh' > /opt/services.log 2>&1 &"""
 
-                commands.append(service_script)
+# Run the deployment script in background after delay.
+# This allows SSH to connect and upload files first.
+_DEPLOY_COMMAND = "nohup bash -c 'sleep 30; /opt/deploy.sh' > /opt/deploy.log 2>&1 &"
+
+
+def _yaml_quote(value: str) -> str:
+    """Quote a value as a single-quoted YAML scalar."""
+    # Escape special characters in YAML
+    escaped = value.replace("'", "''")
+    return f"'{escaped}'"
 
-        # Run the deployment script in background after delay
-        # This allows SSH to connect and upload files first
-        commands.append(
-            "nohup bash -c 'sleep 30; /opt/deploy.sh' > /opt/deploy.log 2>&1 &"
-        )
 
-        if not commands:
+def _runcmd_item(cmd: str) -> str:
+    """Render one runcmd entry, using the literal style for multi-line commands."""
+    if "\n" in cmd:
+        return "\n".join(["  - |", *(f"    {line}" for line in cmd.splitlines())])
+    return f"  - {_yaml_quote(cmd)}"
+
+
+# The runcmd entries that don't depend on the config, rendered once
+_RUNCMD_HEAD = "\n".join(
+    ["runcmd:", _runcmd_item("mkdir -p /opt/deployment"), _runcmd_item(_WAIT_SCRIPT)]
+)
+_RUNCMD_TARBALL = "\n".join(
+    [_runcmd_item(_EXTRACT_SCRIPT), _runcmd_item(_SETUP_SCRIPT)]
+)
+_RUNCMD_TAIL = _runcmd_item(_DEPLOY_COMMAND)
+
+# Rendered cloud-init keyed by (config repr, SSH key, template source). Every
+# region builds its own generator from the same config, so only the first
+# render of a deployment does any work.
+_RENDER_CACHE: dict[tuple[str, Optional[str], str], str] = {}
+
+
+class PortableCloudInitGenerator:
+    """Generates cloud-init configuration from DeploymentConfig."""
+
+    def __init__(
+        self, deployment_config: DeploymentConfig, ssh_public_key: Optional[str] = None
+    ):
+        """Initialize generator with deployment configuration.
+
+        Args:
+            deployment_config: DeploymentConfig object with deployment specs
+            ssh_public_key: Optional SSH public key to add to the ubuntu user
+        """
+        self.config = deployment_config
+        self.ssh_public_key = ssh_public_key
+
+    def _cached(self, source: str, render: Callable[[], str]) -> str:
+        """Return a cached render for this config, rendering it on first use.
+
+        Args:
+            source: Identifies the template used ("" for the built-in layout)
+            render: Callable producing the cloud-init YAML
+
+        Returns:
+            String containing the cloud-init YAML
+        """
+        key = (repr(self.config), self.ssh_public_key, source)
+        cached = _RENDER_CACHE.get(key)
+        if cached is None:
+            cached = render()
+            _RENDER_CACHE[key] = cached
+        return cached
+
+    def generate(self) -> str:
+        """Generate complete cloud-init YAML configuration.
+
+        Returns:
+            String containing the cloud-init YAML
+        """
+        return self._cached("", self._generate)
+
+    def _generate(self) -> str:
+        """Render the built-in cloud-init layout without caching."""
+        sections = []
+
+        # Start with cloud-init header
+        sections.append("#cloud-config")
+
+        # Add package installation
+        if self.config.packages:
+            sections.append(self._generate_packages_section())
+
+        # Add users section (for creating directories)
+        sections.append(self._generate_users_section())
+
+        # Add write_files section for inline files
+        write_files = self._generate_write_files_section()
+        if write_files:
+            sections.append(write_files)
+
+        # Add runcmd section for scripts and setup
+        runcmd = self._generate_runcmd_section()
+        if runcmd:
+            sections.append(runcmd)
+
+        # Join all sections with newlines
+        cloud_init = "\n\n".join(filter(None, sections))
+
+        logger.debug(f"Generated cloud-init with {len(sections)} sections")
+        return cloud_init
+
+    def _generate_packages_section(self) -> str:
+        """Generate packages section for cloud-init.
+
+        Returns:
+            YAML string for packages section
+        """
+        if not self.config.packages:
             return ""
 
-        # Build YAML
-        yaml_lines = ["runcmd:"]
-        for cmd in commands:
-            # For multi-line commands, use the literal style
-            if "\n" in cmd:
-                yaml_lines.append("  - |")
-                for line in cmd.split("\n"):
-                    yaml_lines.append(f"    {line}")
-            else:
-                # Escape special characters in YAML
-                escaped_cmd = cmd.replace("'", "''")
-                yaml_lines.append(f"  - '{escaped_cmd}'")
+        lines = ["packages:"]
+        lines.extend(f"  - {package}" for package in self.config.packages)
 
-        return "\n".join(yaml_lines)
+        logger.debug(
+            f"Generated packages section with {len(self.config.packages)} packages"
+        )
+        return "\n".join(lines)
+
+    def _generate_users_section(self) -> str:
+        """Generate users section to ensure ubuntu user exists.
+
+        Returns:
+            YAML string for users section
+        """
+        # Add SSH key if provided
+        if self.ssh_public_key:
+            return _USERS_YAML_WITH_KEY.format(key=self.ssh_public_key)
+        return _USERS_YAML
+
+    def _generate_write_files_section(self) -> str:
+        """Generate write_files section for inline configuration files.
+
+        Returns:
+            YAML string for write_files section
+        """
+        return _WRITE_FILES_SECTION
+
+    def _generate_runcmd_section(self) -> str:
+        """Generate runcmd section for script execution and tarball handling.
+
+        Returns:
+            YAML string for runcmd section
+        """
+        sections = [_RUNCMD_HEAD]
+
+        # Handle tarball deployment if specified
+        if hasattr(self.config, "tarball_source") and self.config.tarball_source:
+            sections.append(_RUNCMD_TARBALL)
+
+        # Install services if defined
+        if self.config.services:
+            installer = ServiceInstaller(self.config)
+            service_commands = installer.generate_install_commands()
+
+            if service_commands:
+                # Create service installation script
+                service_script = "".join(
+                    [
+                        _SERVICE_SCRIPT_HEADER,
+                        *(
+                            f"{cmd}\n"
+                            for cmd in service_commands
+                            if not cmd.startswith("#")
+                        ),
+                        _SERVICE_SCRIPT_FOOTER,
+                    ]
+                )
+                sections.append(_runcmd_item(service_script))
+
+        sections.append(_RUNCMD_TAIL)
+        return "\n".join(sections)
 
     def generate_with_template(
         self, template_path: Optional[Path] = None, template_name: Optional[str] = None
@@ -325,29 +369,39 @@ nohup bash -c 'sleep 45; /tmp/install_services.sh' > /opt/services.log 2>&1 &"""
         """
         if template_path and template_path.exists():
             # Use provided template file
-            template = CloudInitTemplate(template_path)
             logger.info(f"Using custom template: {template_path}")
-            # Add SSH key as a template variable if available
-            if self.ssh_public_key:
-                template.add_variable("SSH_PUBLIC_KEY", self.ssh_public_key)
-            return template.render(self.config)
+            # Keyed by mtime and size so an edited template is rendered again
+            st = template_path.stat()
+            return self._cached(
+                f"path:{template_path}:{st.st_mtime_ns}:{st.st_size}",
+                lambda: self._render_template(CloudInitTemplate(template_path)),
+            )
         elif template_name:
             # Use library template
             from amauo.templates.cloud_init_templates import TemplateLibrary
 
             try:
-                template = TemplateLibrary.get_template(template_name)
+                rendered = self._cached(
+                    f"name:{template_name}",
+                    lambda: self._render_template(
+                        TemplateLibrary.get_template(template_name)
+                    ),
+                )
                 logger.info(f"Using library template: {template_name}")
-                # Add SSH key as a template variable if available
-                if self.ssh_public_key:
-                    template.add_variable("SSH_PUBLIC_KEY", self.ssh_public_key)
-                return template.render(self.config)
+                return rendered
             except FileNotFoundError as e:
                 logger.warning(f"Template not found: {e}")
 
         # Fall back to regular generation
         return self.generate()
 
+    def _render_template(self, template: CloudInitTemplate) -> str:
+        """Render a template against this generator's config and SSH key."""
+        # Add SSH key as a template variable if available
+        if self.ssh_public_key:
+            template.add_variable("SSH_PUBLIC_KEY", self.ssh_public_key)
+        return template.render(self.config)
+
     def _generate_packages_list(self) -> str:
         """Generate formatted list of packages for template.
 
@@ -415,7 +469,8 @@ nohup bash -c 'sleep 45; /tmp/install_services.sh' > /opt/services.log 2>&1 &"""
             if command and not command.startswith("/"):
                 errors.append(f"Script command should use absolute path: {command}")
 
-        # Check service files exist
+        # Check service files exist, listing each parent directory once
+        listings: dict[Path, Optional[set[str]]] = {}
         for service_item in self.config.services:
             if isinstance(service_item, dict):
                 service_path = service_item.get("path")
@@ -424,7 +479,24 @@ nohup bash -c 'sleep 45; /tmp/install_services.sh' > /opt/services.log 2>&1 &"""
             else:
                 service_path = service_item  # type: ignore[unreachable]
             service_file = Path(service_path)
-            if not service_file.exists():
+            parent = service_file.parent
+            if parent not in listings:
+                try:
+                    with os.scandir(parent) as entries:
+                        # Broken symlinks don't count, matching Path.exists()
+                        listings[parent] = {
+                            entry.name
+                            for entry in entries
+                            if not entry.is_symlink() or os.path.exists(entry.path)
+                        }
+                except OSError:
+                    listings[parent] = None
+            names = listings[parent]
+            if names is None or service_file.name in ("", ".."):
+                exists = service_file.exists()
+            else:
+                exists = service_file.name in names
+            if not exists:
                 errors.append(f"Service file not found: {service_path}")
 
         # Check upload destinations
@@ -518,29 +590,25 @@ class CloudInitBuilder:
         Returns:
             Complete cloud-init YAML string
         """
-        sections = ["#cloud-config"]
+        buf = io.StringIO()
+        buf.write("#cloud-config\n")
 
         # Add packages
         if self.packages:
-            sections.append("packages:")
+            buf.write("packages:\n")
             for pkg in self.packages:
-                sections.append(f"  - {pkg}")
+                buf.write(f"  - {pkg}\n")
 
         # Add files
         if self.files:
-            sections.append("\nwrite_files:")
+            buf.write("\nwrite_files:\n")
             for file_spec in self.files:
-                sections.append(f"  - path: {file_spec['path']}")
-                sections.append(f"    permissions: '{file_spec['permissions']}'")
-                sections.append("    content: |")
-                for line in file_spec["content"].splitlines():
-                    sections.append(f"      {line}")
+                _write_file_spec(buf, file_spec)
 
         # Add commands
         if self.commands:
-            sections.append("\nruncmd:")
+            buf.write("\nruncmd:\n")
             for cmd in self.commands:
-                escaped = cmd.replace("'", "''")
-                sections.append(f"  - '{escaped}'")
+                buf.write(f"  - {_yaml_quote(cmd)}\n")
 
-        return "\n".join(sections)
+        return buf.getvalue().rstrip("\n")
@@ -1,12 +1,16 @@
 """Service installer for systemd services."""
 
 import logging
+import re
 from pathlib import Path
 
 from ..core.deployment import DeploymentConfig
 
 logger = logging.getLogger(__name__)
 
+# After=, Requires= and Wants= directives, matched across a whole unit file
+_DEPENDENCY_DIRECTIVE_RE = re.compile(r"^(?:After|Requires|Wants)=(.*)$", re.MULTILINE)
+
 
 class ServiceInstaller:
     """Handles installation and management of systemd services."""
@@ -252,25 +256,14 @@ echo "Service installation complete!"
         Returns:
             List of dependency service names
         """
-        deps = []
+        deps: list[str] = []
 
         try:
             content = service_path.read_text()
 
-            # Look for After= directive
-            for line in content.split("\n"):
-                if line.startswith("After="):
-                    after_deps = line.replace("After=", "").split()
-                    deps.extend(after_deps)
-
-                # Also check Requires= and Wants=
-                if line.startswith("Requires="):
-                    required = line.replace("Requires=", "").split()
-                    deps.extend(required)
-
-                if line.startswith("Wants="):
-                    wanted = line.replace("Wants=", "").split()
-                    deps.extend(wanted)
+            # One regex pass over the file for After=, Requires= and Wants=
+            for match in _DEPENDENCY_DIRECTIVE_RE.finditer(content):
+                deps.extend(match.group(1).split())
 
         except Exception as e:
             logger.warning(f"Failed to extract dependencies from {service_path}: {e}")
@@ -15,7 +15,8 @@ class ShutdownHandler:
     def __init__(self) -> None:
         """Initialize the shutdown handler."""
         self.ui = UIManager()
-        self._shutdown_requested = False
+        # An Event rather than a flag so waiting loops wake as soon as it is set
+        self._shutdown_event = threading.Event()
         self._cleanup_callbacks: list[Callable[[], None]] = []
         self._lock = threading.Lock()
         self._original_sigint: Optional[
@@ -50,16 +51,24 @@ class ShutdownHandler:
 
     def is_shutdown_requested(self) -> bool:
         """Check if shutdown has been requested."""
-        return self._shutdown_requested
+        return self._shutdown_event.is_set()
+
+    def wait_for_shutdown(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to timeout seconds, returning early if shutdown is requested.
+
+        Returns:
+            True if shutdown has been requested
+        """
+        return self._shutdown_event.wait(timeout)
 
     def _handle_shutdown(self, signum: int, frame: Optional[FrameType]) -> None:
         """Handle shutdown signal."""
-        if self._shutdown_requested:
+        if self._shutdown_event.is_set():
             # Force exit on second signal
             self.ui.print_error("\nForced shutdown!")
             sys.exit(1)
 
-        self._shutdown_requested = True
+        self._shutdown_event.set()
         signal_name = "SIGINT" if signum == signal.SIGINT else "SIGTERM"
 
         self.ui.console.print(
@@ -126,6 +135,14 @@ class ShutdownContext:
         """Check if shutdown has been requested."""
         return self.handler.is_shutdown_requested()
 
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Sleep up to timeout seconds, waking early on shutdown.
+
+        Returns:
+            True if shutdown has been requested
+        """
+        return self.handler.wait_for_shutdown(timeout)
+
 
 def handle_shutdown_in_operation(
     operation_name: str, cleanup_func: Optional[Callable[[], None]] = None
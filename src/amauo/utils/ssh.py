@@ -1,12 +1,48 @@
 """SSH and file transfer utilities."""
 
+import functools
 import os
+import socket
 import subprocess
 import time
 from typing import Callable, Optional
 
 from ..core.constants import DEFAULT_SSH_TIMEOUT
 
+# Exit codes of the remote upload finalize script
+_VERIFY_FAILED = 3
+_MARKER_FAILED = 4
+
+
+@functools.cache
+def ssh_control_args() -> tuple[str, ...]:
+    """SSH options that share one connection per host across ssh/scp calls.
+
+    Uploads run several ssh and scp commands per host, each of which would
+    otherwise pay for a new TCP connection and key exchange. Returns no
+    options where OpenSSH connection multiplexing isn't usable.
+    """
+    if os.name != "posix":
+        return ()
+
+    # Keep the socket path short: Unix socket paths are limited to ~104 bytes
+    control_dir = f"/tmp/amauo-ssh-{os.getuid()}"
+    try:
+        os.makedirs(control_dir, mode=0o700, exist_ok=True)
+        if os.stat(control_dir).st_uid != os.getuid():
+            return ()
+    except OSError:
+        return ()
+
+    return (
+        "-o",
+        "ControlMaster=auto",
+        "-o",
+        f"ControlPath={control_dir}/%C",
+        "-o",
+        "ControlPersist=60",
+    )
+
 
 def _run_scp_with_retry(
     scp_cmd: list,
@@ -51,6 +87,55 @@ def _run_scp_with_retry(
     return False
 
 
+@functools.cache
+def _ssh_probe_target(hostname: str, username: str) -> Optional[tuple[str, int]]:
+    """Resolve where ssh would connect directly, per ssh_config (``ssh -G``).
+
+    Returns None when ssh reaches the host through ProxyJump/ProxyCommand, or
+    its config can't be read: a raw TCP probe can't tell anything then.
+    """
+    try:
+        result = subprocess.run(
+            ["ssh", "-G", f"{username}@{hostname}"],
+            stdin=subprocess.DEVNULL,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+
+    options: dict[str, str] = {}
+    for line in result.stdout.splitlines():
+        key, _, value = line.partition(" ")
+        options[key] = value
+    if any(
+        options.get(key, "none").lower() != "none"
+        for key in ("proxyjump", "proxycommand")
+    ):
+        return None
+    try:
+        return options.get("hostname", hostname), int(options.get("port", 22))
+    except ValueError:
+        return None
+
+
+def _probe_ssh_port(hostname: str, port: int = 22, timeout: float = 3) -> str:
+    """Check whether the SSH port accepts TCP connections.
+
+    Returns "open", "timeout" or "unreachable".
+    """
+    try:
+        with socket.create_connection((hostname, port), timeout=timeout):
+            return "open"
+    except socket.timeout:
+        return "timeout"
+    except OSError:
+        return "unreachable"
+
+
 def wait_for_ssh_only(
     hostname: str,
     username: str,
@@ -67,12 +152,34 @@ def wait_for_ssh_only(
         timeout: Maximum wait time in seconds
         progress_callback: Optional callback(attempt, elapsed, status) for progress updates
     """
-    start_time = time.time()
+    start_time = time.monotonic()
     attempt = 0
 
-    while time.time() - start_time < timeout:
+    while True:
+        # One clock read per attempt, immune to wall-clock adjustments
+        elapsed_seconds = time.monotonic() - start_time
+        if elapsed_seconds >= timeout:
+            break
         attempt += 1
-        elapsed = int(time.time() - start_time)
+        elapsed = int(elapsed_seconds)
+
+        # Only spawn ssh once its port accepts connections; while the instance
+        # boots a plain TCP probe answers the same question without a fork.
+        # The connect itself is the wait: it returns as soon as the port
+        # opens, so a timed-out probe is retried without sleeping. Hosts
+        # reached through a proxy are left to ssh itself.
+        probe_target = _ssh_probe_target(hostname, username)
+        if probe_target:
+            port_status = _probe_ssh_port(
+                *probe_target,
+                timeout=min(5.0, max(timeout - elapsed_seconds, 0.1)),
+            )
+            if port_status != "open":
+                if progress_callback:
+                    progress_callback(attempt, elapsed, port_status)
+                if port_status != "timeout":
+                    time.sleep(2)
+                continue
 
         try:
             result = subprocess.run(
@@ -88,11 +195,15 @@ def wait_for_ssh_only(
                     "LogLevel=ERROR",
                     "-o",
                     "ConnectTimeout=3",
+                    # A successful probe leaves the shared master connection
+                    # up, so the uploads that follow skip the handshake
+                    *ssh_control_args(),
                     f"{username}@{hostname}",
                     'echo "SSH ready"',
                 ],
-                capture_output=True,
-                text=True,
+                # Only the exit status matters, so don't pipe the output back
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
             if result.returncode == 0:
@@ -154,6 +265,7 @@ def transfer_files_scp(
             "StrictHostKeyChecking=no",
             "-o",
             "UserKnownHostsFile=/dev/null",
+            *ssh_control_args(),
             f"{username}@{hostname}",
         ]
 
@@ -205,6 +317,7 @@ def transfer_files_scp(
             "StrictHostKeyChecking=no",
             "-o",
             "UserKnownHostsFile=/dev/null",
+            *ssh_control_args(),
         ]
 
         # Transfer scripts
@@ -279,14 +392,14 @@ def transfer_files_scp(
             update_progress("SCP: Config", 90, "Preparing configuration...")
 
             # Upload config files
-            result = subprocess.run(
+            subprocess.run(
                 scp_base
                 + [
                     f"{config_directory}/.",
                     f"{username}@{hostname}:/tmp/uploaded_files/config/",
                 ],
-                capture_output=True,
-                text=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
                 timeout=120,
             )
 
@@ -317,7 +430,12 @@ def transfer_files_scp(
                 chmod_cmd = ssh_base + [
                     "chmod +x /tmp/uploaded_files/scripts/additional_commands.sh"
                 ]
-                subprocess.run(chmod_cmd, capture_output=True, text=True, timeout=10)
+                subprocess.run(
+                    chmod_cmd,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=10,
+                )
         elif additional_commands_path:
             log_message(
                 f"Warning: additional_commands.sh not found at {additional_commands_path}"
@@ -326,21 +444,23 @@ def transfer_files_scp(
         # Verify files were uploaded
         update_progress("SCP: Verifying", 95, "Verifying upload...")
 
-        verify_cmd = ssh_base + [
-            "ls -la /tmp/uploaded_files/scripts/deploy_services.py && echo 'Files verified'"
+        # Verify, count and mark the upload in a single SSH round trip
+        finalize_cmd = ssh_base + [
+            "ls /tmp/uploaded_files/scripts/deploy_services.py >/dev/null"
+            f" || exit {_VERIFY_FAILED}; "
+            "find /tmp/uploaded_files -type f | wc -l; "
+            f"touch /tmp/uploaded_files_ready || exit {_MARKER_FAILED}"
         ]
 
-        result = subprocess.run(verify_cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
+        result = subprocess.run(
+            finalize_cmd, capture_output=True, text=True, timeout=10
+        )
+        if result.returncode not in (0, _MARKER_FAILED):
             log_error("Failed to verify uploaded files")
             update_progress("SCP: Error", 0, "Upload verification failed")
             return False
 
-        # Count uploaded files
-        count_cmd = ssh_base + ["find /tmp/uploaded_files -type f | wc -l"]
-
-        result = subprocess.run(count_cmd, capture_output=True, text=True, timeout=10)
-        file_count = result.stdout.strip() if result.returncode == 0 else "unknown"
+        file_count = result.stdout.strip() or "unknown"
         log_message(f"Uploaded {file_count} files to /tmp/uploaded_files")
 
         # Trigger cloud-init to run the deployment
@@ -348,11 +468,8 @@ def transfer_files_scp(
             "SCP: Triggering", 98, f"Triggering deployment ({file_count} files)..."
         )
 
-        # Create a marker file to signal that files are ready
-        marker_cmd = ssh_base + ["touch /tmp/uploaded_files_ready"]
-
-        result = subprocess.run(marker_cmd, capture_output=True, text=True, timeout=10)
-        if result.returncode != 0:
+        # The marker file signals that files are ready
+        if result.returncode == _MARKER_FAILED:
             log_error("Failed to create upload marker")
             update_progress("SCP: Error", 0, "Failed to signal upload completion")
             return False
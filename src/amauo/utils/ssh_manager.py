@@ -5,6 +5,10 @@ import time
 from typing import Callable, Optional
 
 from ..core.constants import DEFAULT_SSH_TIMEOUT
+from .ssh import ssh_control_args
+
+# ssh exits with 255 when the connection itself fails
+SSH_CONNECTION_ERROR = 255
 
 
 class SSHManager:
@@ -28,14 +32,24 @@ class SSHManager:
             "ServerAliveInterval=30",
             "-o",
             "ServerAliveCountMax=3",
+            *ssh_control_args(),
         ]
+        # Set once SSH has answered; cleared when ssh reports a connection error
+        self._ssh_verified = False
 
     def wait_for_ssh(self, timeout: int = DEFAULT_SSH_TIMEOUT) -> bool:
-        """Wait for SSH to become available on the host."""
-        start_time = time.time()
+        """Wait for SSH to become available on the host.
+
+        Returns immediately once a previous probe or command has succeeded.
+        """
+        if self._ssh_verified:
+            return True
+
+        start_time = time.monotonic()
 
-        while time.time() - start_time < timeout:
+        while time.monotonic() - start_time < timeout:
             if self._test_ssh_connection():
+                self._ssh_verified = True
                 return True
             time.sleep(2)
 
@@ -52,17 +66,26 @@ class SSHManager:
                 f"{self.username}@{self.hostname}",
                 "echo 'SSH ready'",
             ]
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=5)
+            result = subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
+            )
             return result.returncode == 0
         except Exception:
             return False
 
     def execute_command(
-        self, command: str, timeout: int = 30, retries: int = 3
+        self,
+        command: str,
+        timeout: int = 30,
+        retries: int = 3,
+        capture_stdout: bool = True,
     ) -> tuple[bool, str, str]:
         """
         Execute a command on the remote host with retry logic.
 
+        With capture_stdout=False the remote output is discarded instead of
+        piped back, for fire-and-forget commands; stdout is then always "".
+
         Returns:
             Tuple of (success, stdout, stderr)
         """
@@ -75,17 +98,25 @@ class SSHManager:
             command,
         ]
 
+        stdout = subprocess.PIPE if capture_stdout else subprocess.DEVNULL
         for attempt in range(retries):
             try:
                 result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=timeout
+                    cmd,
+                    stdout=stdout,
+                    stderr=subprocess.PIPE,
+                    text=True,
+                    timeout=timeout,
                 )
                 if result.returncode == 0:
-                    return True, result.stdout, result.stderr
-                elif attempt < retries - 1:
+                    self._ssh_verified = True
+                    return True, result.stdout or "", result.stderr
+                if result.returncode == SSH_CONNECTION_ERROR:
+                    self._ssh_verified = False
+                if attempt < retries - 1:
                     time.sleep(2**attempt)  # Exponential backoff
                 else:
-                    return False, result.stdout, result.stderr
+                    return False, result.stdout or "", result.stderr
             except subprocess.TimeoutExpired:
                 if attempt < retries - 1:
                     time.sleep(2**attempt)
@@ -210,14 +241,14 @@ class BatchSSHManager:
             Dict mapping hostname to success status
         """
         results = {}
-        start_time = time.time()
+        start_time = time.monotonic()
         remaining_timeout = timeout
 
         for hostname, manager in self.managers.items():
             if callback:
                 callback(f"Waiting for SSH on {hostname}...")
 
-            elapsed = time.time() - start_time
+            elapsed = time.monotonic() - start_time
             remaining_timeout = max(
                 10, int(timeout - elapsed)
             )  # At least 10 seconds per host
@@ -58,9 +58,7 @@ def add_destroy_row(
 ) -> None:
     """Add a row to a destroy table with proper string conversion."""
     table.add_row(
-        str(region),
-        str(instance_id),
-        str(status),
+        *map(str, (region, instance_id, status)),
         "",  # Type column (empty for destroy)
         "",  # Public IP column (empty for destroy)
         "",  # Created column (empty for destroy)
@@ -12,6 +12,16 @@ from ..utils.ui_manager import UIManager
 
 logger = logging.getLogger(__name__)
 
+# Leading bytes of the compressed formats accepted by validate_tarball
+COMPRESSED_MAGIC = {
+    ".tar.gz": b"\x1f\x8b",
+    ".tgz": b"\x1f\x8b",
+    ".tar.bz2": b"BZh",
+}
+
+# Member name prefixes that would escape the extraction directory
+UNSAFE_MEMBER_PREFIXES = ("..", "/")
+
 
 class TarballHandler:
     """Handles tarball creation and extraction for deployments."""
@@ -65,16 +75,17 @@ class TarballHandler:
 
         logger.info(f"Creating tarball from {source_dir} to {output_path}")
 
+        # Split the patterns once: "*.ext" globs match the end of the name,
+        # anything else matches anywhere in the path
+        exclude_suffixes = tuple(p[1:] for p in exclude_patterns if p.startswith("*"))
+        exclude_substrings = [p for p in exclude_patterns if not p.startswith("*")]
+
         def should_exclude(path: Path) -> bool:
             """Check if path should be excluded."""
-            name = path.name
-            for pattern in exclude_patterns:
-                if pattern.startswith("*"):
-                    if name.endswith(pattern[1:]):
-                        return True
-                elif pattern in str(path):
-                    return True
-            return False
+            if path.name.endswith(exclude_suffixes):
+                return True
+            path_str = str(path)
+            return any(pattern in path_str for pattern in exclude_substrings)
 
         # Create tarball
         with tarfile.open(output_path, "w:gz") as tar:
@@ -116,7 +127,7 @@ class TarballHandler:
             # Validate members for security
             for member in tar.getmembers():
                 # Prevent path traversal
-                if member.name.startswith("..") or member.name.startswith("/"):
+                if member.name.startswith(UNSAFE_MEMBER_PREFIXES):
                     raise ValueError(f"Unsafe path in tarball: {member.name}")
 
             tar.extractall(dest_dir)
@@ -209,16 +220,35 @@ echo "Deployment package extracted to {extract_dir}"
             return False, f"Not a file: {tarball_path}"
 
         # Check extension
-        valid_extensions = {".tar", ".tar.gz", ".tgz", ".tar.bz2"}
-        if not any(str(tarball_path).endswith(ext) for ext in valid_extensions):
+        valid_extensions = (".tar", ".tar.gz", ".tgz", ".tar.bz2")
+        if not str(tarball_path).endswith(valid_extensions):
             return False, f"Invalid tarball extension: {tarball_path.suffix}"
 
+        # Reject files whose header does not match the compression their
+        # extension claims before decompressing anything
+        expected_magic = next(
+            (
+                magic
+                for ext, magic in COMPRESSED_MAGIC.items()
+                if str(tarball_path).endswith(ext)
+            ),
+            None,
+        )
+        if expected_magic is not None:
+            try:
+                with open(tarball_path, "rb") as f:
+                    header = f.read(len(expected_magic))
+            except OSError as e:
+                return False, f"Invalid tarball: {e}"
+            if header != expected_magic:
+                return False, "Invalid tarball: unexpected file header"
+
         # Try to open it
         try:
             with tarfile.open(tarball_path, "r:*") as tar:
-                # Check for dangerous paths
-                for member in tar.getmembers():
-                    if member.name.startswith("..") or member.name.startswith("/"):
+                # Stream members so an unsafe path stops the scan immediately
+                for member in tar:
+                    if member.name.startswith(UNSAFE_MEMBER_PREFIXES):
                         return False, f"Unsafe path in tarball: {member.name}"
             return True, ""
         except Exception as e:
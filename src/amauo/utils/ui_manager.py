@@ -1,5 +1,7 @@
 """Unified UI Manager for all Rich display operations."""
 
+import functools
+import re
 from typing import Any, Callable, Optional, cast
 
 from rich.console import Console
@@ -8,6 +10,48 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.table import Table
 
+# Standard instance table columns with consistent widths
+_INSTANCE_COLUMNS: tuple[dict[str, Any], ...] = (
+    {"header": "Region", "style": "magenta", "width": 16, "no_wrap": True},
+    {"header": "Instance ID", "style": "cyan", "width": 22, "no_wrap": True},
+    {"header": "Status", "style": "yellow", "width": 22, "no_wrap": True},
+    {"header": "Upload", "style": "blue", "width": 12, "no_wrap": True},
+    {"header": "Type", "style": "green", "width": 10, "no_wrap": True},
+    {"header": "Public IP", "style": "blue", "width": 16, "no_wrap": True},
+    {"header": "Created", "style": "white", "width": 20, "no_wrap": True},
+)
+
+# Progress panel key keywords, matched case-insensitively, and the color
+# each group gets
+_PANEL_KEY_COLORS = (
+    (re.compile("completed|success", re.IGNORECASE), "green"),
+    (re.compile("failed|error", re.IGNORECASE), "red"),
+    (re.compile("progress|pending", re.IGNORECASE), "yellow"),
+)
+
+
+@functools.lru_cache(maxsize=256)
+def _status_color(status: str) -> Optional[str]:
+    """Pick the color for a status string.
+
+    Tables are redrawn several times a second from a small set of distinct
+    status strings, so the classification is cached.
+    """
+    upper = status.upper()
+    # Success statuses
+    if any(marker in upper for marker in ("SUCCESS", "COMPLETE", "✓")):
+        return "green"
+    # Error statuses
+    if any(marker in upper for marker in ("ERROR", "FAILED", "✗")):
+        return "red"
+    # In-progress statuses
+    if any(marker in status for marker in ("⏳", "...", "WAIT")):
+        return "yellow"
+    # Skipped/special statuses
+    if "SKIPPED" in upper:
+        return "dim"
+    return None
+
 
 class UIManager:
     """Centralized manager for all Rich UI operations."""
@@ -40,15 +84,8 @@ class UIManager:
             header_style=header_style,
             width=134,  # Fixed width for consistency
         )
-
-        # Standard columns with consistent widths
-        table.add_column("Region", style="magenta", width=16, no_wrap=True)
-        table.add_column("Instance ID", style="cyan", width=22, no_wrap=True)
-        table.add_column("Status", style="yellow", width=22, no_wrap=True)
-        table.add_column("Upload", style="blue", width=12, no_wrap=True)
-        table.add_column("Type", style="green", width=10, no_wrap=True)
-        table.add_column("Public IP", style="blue", width=16, no_wrap=True)
-        table.add_column("Created", style="white", width=20, no_wrap=True)
+        for column in _INSTANCE_COLUMNS:
+            table.add_column(**column)
 
         return table
 
@@ -65,37 +102,32 @@ class UIManager:
     ) -> None:
         """Add a row to an instance table."""
         table.add_row(
-            str(region),
-            str(instance_id),
-            str(status),
-            str(upload_status),
-            str(instance_type),
-            str(public_ip),
-            str(created),
+            *map(
+                str,
+                (
+                    region,
+                    instance_id,
+                    status,
+                    upload_status,
+                    instance_type,
+                    public_ip,
+                    created,
+                ),
+            )
         )
 
     def format_status(self, status: str, detail: str = "") -> str:
         """Format status with color coding."""
-        # Success statuses
-        if any(marker in status.upper() for marker in ["SUCCESS", "COMPLETE", "✓"]):
-            status_display = f"[green]{status}[/green]"
-        # Error statuses
-        elif any(marker in status.upper() for marker in ["ERROR", "FAILED", "✗"]):
-            status_display = f"[red]{status}[/red]"
-        # In-progress statuses
-        elif any(marker in status for marker in ["⏳", "...", "WAIT"]):
-            status_display = f"[yellow]{status}[/yellow]"
-        # Skipped/special statuses
-        elif "SKIPPED" in status.upper():
-            status_display = f"[dim]{status}[/dim]"
-        else:
-            status_display = status
+        color = _status_color(status)
+        status_display = f"[{color}]{status}[/{color}]" if color else status
 
         # Add detail if provided
         if detail:
             if len(detail) > 47:
-                detail = detail[:44] + "..."
-            status_display = f"{status_display} {detail}"
+                # Precision in the format spec truncates without a slice copy
+                status_display = f"{status_display} {detail:.44}..."
+            else:
+                status_display = f"{status_display} {detail}"
 
         return status_display
 
@@ -103,11 +135,11 @@ class UIManager:
         self, title: str, content: dict[str, Any], border_style: str = "blue"
     ) -> Panel:
         """Create a progress panel with formatted content."""
-        lines = []
+        lines: list[str] = []
 
         # Add title if different from panel title
         if "title" in content:
-            lines.append(f"[bold]{content['title']}[/bold]\n")
+            lines.extend((f"[bold]{content['title']}[/bold]", ""))
 
         # Format key-value pairs
         for key, value in content.items():
@@ -115,12 +147,12 @@ class UIManager:
                 continue
 
             # Apply color based on key
-            if "completed" in key.lower() or "success" in key.lower():
-                lines.append(f"[green]{key}: {value}[/green]")
-            elif "failed" in key.lower() or "error" in key.lower():
-                lines.append(f"[red]{key}: {value}[/red]")
-            elif "progress" in key.lower() or "pending" in key.lower():
-                lines.append(f"[yellow]{key}: {value}[/yellow]")
+            color = next(
+                (color for pattern, color in _PANEL_KEY_COLORS if pattern.search(key)),
+                None,
+            )
+            if color:
+                lines.append(f"[{color}]{key}: {value}[/{color}]")
             else:
                 lines.append(f"{key}: {value}")
 
@@ -1,7 +1,5 @@
 """Tests for CLI interface."""
 
-import tempfile
-
 import pytest
 import yaml
 from click.testing import CliRunner
@@ -80,7 +78,7 @@ def test_config_file_missing():
 
 
 @pytest.fixture
-def temp_config():
+def temp_config(tmp_path):
     """Create a temporary config file."""
     config = {
         "aws": {
@@ -91,22 +89,17 @@ def temp_config():
         "regions": [{"us-west-2": {"machine_type": "t3.small", "image": "auto"}}],
     }
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(config, f)
-        return f.name
+    path = tmp_path / "config.yaml"
+    path.write_text(yaml.dump(config))
+    return str(path)
 
 
-def test_setup_command():
+def test_setup_command(tmp_path):
     """Test setup command creates config."""
     runner = CliRunner()
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        config_path = f.name
-
-    # Remove the file so setup can create it
-    import os
-
-    os.unlink(config_path)
+    # A path that doesn't exist yet, so setup can create it
+    config_path = str(tmp_path / "config.yaml")
 
     # This should create the config file
     result = runner.invoke(cli, ["-c", config_path, "setup"])
@@ -0,0 +1,26 @@
+"""Tests for cloud-init template rendering."""
+
+from amauo.templates.cloud_init_templates import CloudInitTemplate
+
+
+def test_render_substitutes_names_accepted_by_validate(tmp_path):
+    """Variable names with '-' or '.' are rendered, not just validated."""
+    path = tmp_path / "template.yaml"
+    path.write_text("runcmd:\n  - echo {{MY-VAR}} ${app.name}\n")
+
+    template = CloudInitTemplate(path)
+    template.set_variables({"MY-VAR": "hello", "app.name": "web"})
+
+    assert template.validate() == (True, [])
+    assert template.render() == "runcmd:\n  - echo hello web\n"
+
+
+def test_render_dollar_before_double_brace(tmp_path):
+    """'${{VAR}}' substitutes the inner '{{VAR}}' and keeps the '$'."""
+    path = tmp_path / "template.yaml"
+    path.write_text("a: ${{VAR}} {{VAR}}\n")
+
+    template = CloudInitTemplate(path)
+    template.set_variables({"VAR": "x"})
+
+    assert template.render() == "a: $x x\n"
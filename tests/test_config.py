@@ -0,0 +1,29 @@
+"""Tests for cached YAML config loading."""
+
+import os
+
+from amauo.core.config import load_yaml_file
+
+
+def test_load_yaml_file_returns_independent_copies(tmp_path):
+    """Mutating a loaded config does not leak into later loads."""
+    path = tmp_path / "config.yaml"
+    path.write_text("aws:\n  total_instances: 2\n")
+
+    first = load_yaml_file(path)
+    first["aws"]["total_instances"] = 99
+
+    assert load_yaml_file(path) == {"aws": {"total_instances": 2}}
+
+
+def test_load_yaml_file_reparses_changed_file(tmp_path):
+    """A file modified on disk is parsed again."""
+    path = tmp_path / "config.yaml"
+    path.write_text("regions: []\n")
+    assert load_yaml_file(path) == {"regions": []}
+
+    path.write_text("regions: [us-west-2]\n")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+    assert load_yaml_file(path) == {"regions": ["us-west-2"]}
@@ -0,0 +1,22 @@
+"""Tests for create command helpers."""
+
+import pytest
+
+from amauo.commands.create import _upload_stage
+
+
+@pytest.mark.parametrize(
+    ("status", "expected"),
+    [
+        ("Waiting for SSH", ("🔐", "-")),
+        ("SSH ready, uploading tarball", ("🔐", "-")),
+        ("Running setupload", ("📦", "uploading")),
+        ("Setup verification", ("✓", "verifying")),
+        ("Setup complete", ("⚙️", "✓")),
+        ("Complete", ("✅", "✓")),
+        ("ssh pending", ("📤", "preparing")),
+    ],
+)
+def test_upload_stage_uses_keyword_priority(status, expected):
+    """The highest-priority keyword wins, even when keywords overlap."""
+    assert _upload_stage(status) == expected
@@ -0,0 +1,22 @@
+"""Tests for upload size estimation."""
+
+import os
+
+from amauo.core.deployment import DeploymentConfig
+from amauo.utils.file_uploader import FileUploader
+
+
+def test_estimate_upload_size_ignores_symlink_loops(tmp_path):
+    """Symlinked directories aren't followed; symlinked files count their target."""
+    source = tmp_path / "files"
+    (source / "sub").mkdir(parents=True)
+    (source / "a.txt").write_bytes(b"x" * 10)
+    (source / "sub" / "b.txt").write_bytes(b"y" * 5)
+    os.symlink(source, source / "sub" / "loop")
+    os.symlink("self", source / "self")
+    os.symlink(source / "a.txt", source / "link.txt")
+
+    config = DeploymentConfig(uploads=[{"source": "files", "destination": "/opt"}])
+    uploader = FileUploader(config, tmp_path)
+
+    assert uploader.estimate_upload_size() == 25
@@ -0,0 +1,83 @@
+"""Tests for the list command's AWS state refresh."""
+
+import pytest
+from botocore.exceptions import ClientError
+
+from amauo.commands import list as list_cmd
+from amauo.utils import aws_manager
+
+
+class FakeEC2:
+    """Minimal EC2 client stub recording describe calls."""
+
+    def __init__(self, states, purged=()):
+        self.states = states
+        self.purged = set(purged)
+        self.calls = []
+
+    def describe_instance_status(self, InstanceIds, IncludeAllInstances, Filters):
+        self.calls.append(("status", InstanceIds))
+        if self.purged.intersection(InstanceIds):
+            raise ClientError(
+                {"Error": {"Code": "InvalidInstanceID.NotFound"}},
+                "DescribeInstanceStatus",
+            )
+        return {
+            "InstanceStatuses": [
+                {"InstanceId": i, "InstanceState": {"Name": self.states[i]}}
+                for i in InstanceIds
+                if i in self.states
+            ]
+        }
+
+    def describe_instances(self, Filters):
+        ids = next(f["Values"] for f in Filters if f["Name"] == "instance-id")
+        self.calls.append(("instances", ids))
+        instances = [
+            {"InstanceId": i, "State": {"Name": self.states[i]}}
+            for i in ids
+            if i in self.states
+        ]
+        return {"Reservations": [{"Instances": instances}]}
+
+
+@pytest.fixture
+def fake_clients(monkeypatch):
+    """Replace the per-region EC2 clients with stubs."""
+    clients = {}
+    monkeypatch.setattr(aws_manager, "get_ec2_client", clients.__getitem__)
+    return clients
+
+
+def test_refresh_batches_per_region(fake_clients):
+    """One request per region, missing IDs reported as terminated."""
+    fake_clients["us-west-2"] = FakeEC2({"i-1": "running", "i-2": "stopped"})
+    fake_clients["eu-west-1"] = FakeEC2({})
+
+    instances = [
+        {"id": "i-1", "region": "us-west-2"},
+        {"id": "i-2", "region": "us-west-2"},
+        {"id": "i-3", "region": "eu-west-1"},
+    ]
+    states = list_cmd.refresh_instance_states(instances)
+
+    assert states == {"i-1": "running", "i-2": "stopped", "i-3": "terminated"}
+    assert len(fake_clients["us-west-2"].calls) == 1
+    assert len(fake_clients["eu-west-1"].calls) == 1
+
+
+def test_refresh_falls_back_when_ids_purged(fake_clients):
+    """IDs unknown to DescribeInstanceStatus are resolved via DescribeInstances."""
+    fake_clients["us-west-2"] = FakeEC2({"i-1": "running"}, purged={"i-old"})
+
+    instances = [
+        {"id": "i-1", "region": "us-west-2"},
+        {"id": "i-old", "region": "us-west-2"},
+    ]
+    states = list_cmd.refresh_instance_states(instances)
+
+    assert states == {"i-1": "running", "i-old": "terminated"}
+    assert [call[0] for call in fake_clients["us-west-2"].calls] == [
+        "status",
+        "instances",
+    ]